@@ -12,20 +12,39 @@ PROJECT_ROOT = Path(__file__).parent.parent
 MONGODB_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DEFAULT_DB = os.environ.get("MONGODB_DEFAULT_DB")
 
-# Connection pool configuration
-MONGODB_MIN_POOL_SIZE = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "0"))
-MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "100"))
+# Connection pool configuration. A warm minimum pool avoids cold-handshake
+# latency on the first burst of tool calls; the wait queue timeout keeps
+# callers from blocking indefinitely when the pool is exhausted.
+MONGODB_MIN_POOL_SIZE = int(os.environ.get("MONGODB_MIN_POOL_SIZE", "10"))
+MONGODB_MAX_POOL_SIZE = int(os.environ.get("MONGODB_MAX_POOL_SIZE", "200"))
 MONGODB_MAX_IDLE_TIME_MS = int(os.environ.get("MONGODB_MAX_IDLE_TIME_MS", "30000"))
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+MONGODB_MAX_CONNECTING = int(os.environ.get("MONGODB_MAX_CONNECTING", "10"))
+
+# Client identification and wire compression
+MONGODB_APP_NAME = os.environ.get("MONGODB_APP_NAME", "mongo-mcp")
+MONGODB_COMPRESSORS = os.environ.get("MONGODB_COMPRESSORS")  # e.g. "zstd,snappy,zlib"
 
 # Operation timeout configuration
 MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000"))
 MONGODB_SOCKET_TIMEOUT_MS = int(os.environ.get("MONGODB_SOCKET_TIMEOUT_MS", "0"))  # 0 means no timeout
 MONGODB_CONNECT_TIMEOUT_MS = int(os.environ.get("MONGODB_CONNECT_TIMEOUT_MS", "20000"))
+# Server-side execution cap for user-supplied read queries; a runaway
+# unindexed find is aborted by the server instead of pinning a connection
+MONGODB_MAX_TIME_MS = int(os.environ.get("MONGODB_MAX_TIME_MS", "30000"))
 
 # Operation limits
 MONGODB_MAX_DOCUMENTS_LIMIT = int(os.environ.get("MONGODB_MAX_DOCUMENTS_LIMIT", "1000"))
 MONGODB_DEFAULT_BATCH_SIZE = int(os.environ.get("MONGODB_DEFAULT_BATCH_SIZE", "100"))
 
+# How long cached metadata reads (database/collection listings and stats)
+# stay valid; 0 disables caching
+METADATA_CACHE_TTL = float(os.environ.get("METADATA_CACHE_TTL", "15"))
+
+# How long cached index listings stay fresh; stale entries are still served
+# while a background refresh runs
+INDEX_CACHE_TTL = float(os.environ.get("INDEX_CACHE_TTL", "30"))
+
 # Security configuration
 MONGODB_TLS_ENABLED = os.environ.get("MONGODB_TLS_ENABLED", "false").lower() == "true"
 MONGODB_TLS_CA_FILE = os.environ.get("MONGODB_TLS_CA_FILE")
@@ -53,6 +72,7 @@ LOG_MAX_FILE_SIZE = int(os.environ.get("LOG_MAX_FILE_SIZE", "10485760"))  # 10MB
 LOG_BACKUP_COUNT = int(os.environ.get("LOG_BACKUP_COUNT", "5"))
 
 # Feature flags
+MONGODB_VERBOSE_STARTUP = os.environ.get("MONGODB_VERBOSE_STARTUP", "false").lower() == "true"
 ENABLE_DANGEROUS_OPERATIONS = os.environ.get("ENABLE_DANGEROUS_OPERATIONS", "false").lower() == "true"
 ENABLE_ADMIN_OPERATIONS = os.environ.get("ENABLE_ADMIN_OPERATIONS", "true").lower() == "true"
 ENABLE_INDEX_OPERATIONS = os.environ.get("ENABLE_INDEX_OPERATIONS", "true").lower() == "true"
@@ -93,11 +113,17 @@ def log_configuration():
     logger.info(f"MongoDB URI: {MONGODB_URI}")
     logger.info(f"Default Database: {MONGODB_DEFAULT_DB or 'Not set'}")
     logger.info(f"Connection Pool: {MONGODB_MIN_POOL_SIZE}-{MONGODB_MAX_POOL_SIZE}")
+    logger.info(f"Wait Queue Timeout: {MONGODB_WAIT_QUEUE_TIMEOUT_MS}ms")
+    logger.info(f"Max Connecting: {MONGODB_MAX_CONNECTING}")
+    logger.info(f"App Name: {MONGODB_APP_NAME}")
     logger.info(f"Server Selection Timeout: {MONGODB_SERVER_SELECTION_TIMEOUT_MS}ms")
     logger.info(f"Socket Timeout: {MONGODB_SOCKET_TIMEOUT_MS}ms")
     logger.info(f"Connect Timeout: {MONGODB_CONNECT_TIMEOUT_MS}ms")
+    logger.info(f"Max Query Time: {MONGODB_MAX_TIME_MS}ms")
     logger.info(f"Max Documents Limit: {MONGODB_MAX_DOCUMENTS_LIMIT}")
     logger.info(f"Default Batch Size: {MONGODB_DEFAULT_BATCH_SIZE}")
+    logger.info(f"Metadata Cache TTL: {METADATA_CACHE_TTL}s")
+    logger.info(f"Index Cache TTL: {INDEX_CACHE_TTL}s")
     logger.info(f"TLS Enabled: {MONGODB_TLS_ENABLED}")
     logger.info(f"Read Preference: {MONGODB_READ_PREFERENCE}")
     logger.info(f"Write Concern W: {MONGODB_WRITE_CONCERN_W}")
@@ -117,14 +143,21 @@ def get_connection_options():
         "minPoolSize": MONGODB_MIN_POOL_SIZE,
         "maxPoolSize": MONGODB_MAX_POOL_SIZE,
         "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+        "maxConnecting": MONGODB_MAX_CONNECTING,
         "serverSelectionTimeoutMS": MONGODB_SERVER_SELECTION_TIMEOUT_MS,
         "connectTimeoutMS": MONGODB_CONNECT_TIMEOUT_MS,
         "authSource": MONGODB_AUTH_SOURCE,
+        "appname": MONGODB_APP_NAME,
     }
-    
+
     # Add socket timeout if specified
     if MONGODB_SOCKET_TIMEOUT_MS > 0:
         options["socketTimeoutMS"] = MONGODB_SOCKET_TIMEOUT_MS
+
+    # Add wire compression if configured (requires the matching compressor library)
+    if MONGODB_COMPRESSORS:
+        options["compressors"] = MONGODB_COMPRESSORS
     
     # Add TLS options if enabled
     if MONGODB_TLS_ENABLED:
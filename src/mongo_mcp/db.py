@@ -1,21 +1,91 @@
 """Database connection module for mongo-mcp."""
 
-from typing import Optional, Dict, Any, List
-from pymongo import MongoClient
-from pymongo.database import Database
-from pymongo.collection import Collection
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from bson.objectid import ObjectId
+from pymongo import AsyncMongoClient, MongoClient
 from pymongo.errors import PyMongoError
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import ReadPreference
+from pymongo.write_concern import WriteConcern
 
 from mongo_mcp.config import (
-    MONGODB_URI, 
-    MONGODB_DEFAULT_DB, 
+    MONGODB_URI,
+    MONGODB_DEFAULT_DB,
+    MONGODB_READ_PREFERENCE,
+    MONGODB_WRITE_CONCERN_W,
+    MONGODB_WRITE_CONCERN_J,
+    MONGODB_READ_CONCERN_LEVEL,
+    MONGODB_VERBOSE_STARTUP,
     logger,
     get_connection_options,
     log_configuration
 )
 
-# Global client instance
+if TYPE_CHECKING:
+    # Typing-only imports — with postponed annotation evaluation these
+    # submodules are never loaded at runtime
+    from pymongo.asynchronous.collection import AsyncCollection
+    from pymongo.asynchronous.database import AsyncDatabase
+    from pymongo.collection import Collection
+    from pymongo.database import Database
+
+# Non-default read/write preference objects, built once at import time so
+# get_database doesn't reconstruct them on every call
+_READ_PREF_MAP = {
+    "secondary": ReadPreference.SECONDARY,
+    "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+    "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+    "nearest": ReadPreference.NEAREST,
+}
+_CONFIGURED_READ_PREFERENCE = _READ_PREF_MAP.get(MONGODB_READ_PREFERENCE) \
+    if MONGODB_READ_PREFERENCE != "primary" else None
+
+_CONFIGURED_WRITE_CONCERN = None
+if MONGODB_WRITE_CONCERN_W != "1" or MONGODB_WRITE_CONCERN_J:
+    _w_value = int(MONGODB_WRITE_CONCERN_W) if MONGODB_WRITE_CONCERN_W.isdigit() else MONGODB_WRITE_CONCERN_W
+    _CONFIGURED_WRITE_CONCERN = WriteConcern(w=_w_value, j=MONGODB_WRITE_CONCERN_J)
+
+_CONFIGURED_READ_CONCERN = ReadConcern(level=MONGODB_READ_CONCERN_LEVEL) \
+    if MONGODB_READ_CONCERN_LEVEL != "local" else None
+
+# True when any non-default preference is configured; in the common all-
+# defaults deployment get_database reduces to a plain client dict lookup
+_HAS_NON_DEFAULT_PREFERENCES = (
+    _CONFIGURED_READ_PREFERENCE is not None
+    or _CONFIGURED_WRITE_CONCERN is not None
+    or _CONFIGURED_READ_CONCERN is not None
+)
+
+# serverStatus sections suppressed when only summary information is needed;
+# they dominate the payload size (wiredTiger/metrics alone can be 100+ KB)
+_SERVER_STATUS_SUMMARY_CMD = {
+    "serverStatus": 1,
+    "asserts": 0,
+    "metrics": 0,
+    "wiredTiger": 0,
+    "tcmalloc": 0,
+    "locks": 0,
+    "repl": 0,
+}
+
+# System databases that should be hidden from user-facing listings
+_SYSTEM_DBS = frozenset({"admin", "local", "config"})
+
+# Global client instances (sync and async share configuration)
 _client: Optional[MongoClient] = None
+_async_client: Optional[AsyncMongoClient] = None
+
+# Short-lived cache for get_connection_info so polling dashboards don't
+# re-inspect the topology on every call
+_CONNINFO_TTL = 5.0
+_conninfo_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
 
 def get_client() -> MongoClient:
@@ -40,42 +110,11 @@ def get_client() -> MongoClient:
             
             # Ping the server to validate connection
             _client.admin.command('ping')
-            
-            # 获取并打印更详细的连接信息
-            server_info = _client.server_info()
-            server_status = _client.admin.command('serverStatus')
-            
-            # 打印详细的连接信息
-            logger.info("=== MongoDB 连接信息 ===")
-            logger.info(f"MongoDB 版本: {server_info.get('version', 'Unknown')}")
-            logger.info(f"MongoDB 服务器: {MONGODB_URI}")
-            logger.info(f"默认数据库: {MONGODB_DEFAULT_DB or '未设置'}")
-            logger.info(f"当前连接数: {server_status.get('connections', {}).get('current', 'Unknown')}")
-            logger.info(f"可用连接数: {server_status.get('connections', {}).get('available', 'Unknown')}")
-            logger.info(f"已创建连接数: {server_status.get('connections', {}).get('totalCreated', 'Unknown')}")
-            
-            # 列出所有可用的数据库
-            try:
-                database_names = _client.list_database_names()
-                user_databases = [db for db in database_names if db not in ['admin', 'local', 'config']]
-                logger.info(f"用户数据库列表: {', '.join(user_databases) if user_databases else '无'}")
-                logger.info(f"系统数据库列表: admin, local, config")
-            except Exception as e:
-                logger.warning(f"无法列出数据库: {e}")
-            
-            # Check if this is a replica set
-            try:
-                is_master_result = _client.admin.command("hello")
-                if is_master_result.get("setName"):
-                    logger.info(f"副本集名称: {is_master_result.get('setName')}")
-                    logger.info(f"主节点: {is_master_result.get('isWritablePrimary', is_master_result.get('isMaster'))}")
-                else:
-                    logger.info("连接类型: 单实例 MongoDB")
-            except Exception as e:
-                logger.warning(f"无法检查副本集状态: {e}")
-            
-            logger.info("=== 连接信息结束 ===")
-            
+
+            # 详细的连接诊断信息开销较大，仅在显式开启时收集
+            if MONGODB_VERBOSE_STARTUP and logger.isEnabledFor(logging.INFO):
+                _log_server_diagnostics(_client)
+
             logger.info("Successfully connected to MongoDB with enhanced configuration")
         except PyMongoError as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
@@ -83,70 +122,144 @@ def get_client() -> MongoClient:
     return _client
 
 
+@lru_cache(maxsize=1)
+def _static_server_info(client_id: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Fetch server_info and hello once per client lifetime.
+
+    These values (version, wire versions, maxBsonObjectSize, ...) are static
+    for the life of a connection, so repeated calls are pure RTT waste. Keyed
+    by id(_client) and cleared in close_connection().
+
+    Args:
+        client_id: id() of the active client, used as cache key
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: (server_info, hello) results
+    """
+    return _client.server_info(), _client.admin.command("hello")
+
+
+def get_static_server_info() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Get cached server_info and hello results for the current client.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any]]: (server_info, hello) results
+    """
+    client = get_client()
+    return _static_server_info(id(client))
+
+
+def _log_server_diagnostics(client: MongoClient) -> None:
+    """Log detailed server diagnostics for a freshly connected client.
+
+    These commands (server_info, serverStatus, hello, listDatabases) are
+    expensive and only run when MONGODB_VERBOSE_STARTUP is enabled.
+
+    Args:
+        client: Connected MongoDB client
+    """
+    server_info, hello_result = get_static_server_info()
+    server_status = client.admin.command(_SERVER_STATUS_SUMMARY_CMD)
+
+    # 打印详细的连接信息
+    logger.info("=== MongoDB 连接信息 ===")
+    logger.info(f"MongoDB 版本: {server_info.get('version', 'Unknown')}")
+    logger.info(f"MongoDB 服务器: {MONGODB_URI}")
+    logger.info(f"默认数据库: {MONGODB_DEFAULT_DB or '未设置'}")
+    logger.info(f"当前连接数: {server_status.get('connections', {}).get('current', 'Unknown')}")
+    logger.info(f"可用连接数: {server_status.get('connections', {}).get('available', 'Unknown')}")
+    logger.info(f"已创建连接数: {server_status.get('connections', {}).get('totalCreated', 'Unknown')}")
+
+    # 列出所有可用的数据库
+    try:
+        # nameOnly avoids server-side per-database size computation
+        user_databases = []
+        system_databases = []
+        for db in client.list_databases(nameOnly=True):
+            if db["name"] in _SYSTEM_DBS:
+                system_databases.append(db["name"])
+            else:
+                user_databases.append(db["name"])
+        logger.info(f"用户数据库列表: {', '.join(user_databases) if user_databases else '无'}")
+        logger.info(f"系统数据库列表: {', '.join(system_databases)}")
+    except Exception as e:
+        logger.warning(f"无法列出数据库: {e}")
+
+    # Check if this is a replica set
+    try:
+        is_master_result = hello_result
+        if is_master_result.get("setName"):
+            logger.info(f"副本集名称: {is_master_result.get('setName')}")
+            logger.info(f"主节点: {is_master_result.get('isWritablePrimary', is_master_result.get('isMaster'))}")
+        else:
+            logger.info("连接类型: 单实例 MongoDB")
+    except Exception as e:
+        logger.warning(f"无法检查副本集状态: {e}")
+
+    logger.info("=== 连接信息结束 ===")
+
+
+@lru_cache(maxsize=32)
+def _build_database(db_name: str) -> Database:
+    """Build a Database handle with configured read/write preferences applied.
+
+    Memoized per database name; cleared in close_connection().
+
+    Args:
+        db_name: Name of the database
+
+    Returns:
+        Database: MongoDB database instance
+    """
+    database = get_client()[db_name]
+
+    if _CONFIGURED_READ_PREFERENCE is not None:
+        database = database.with_options(read_preference=_CONFIGURED_READ_PREFERENCE)
+
+    if _CONFIGURED_WRITE_CONCERN is not None:
+        database = database.with_options(write_concern=_CONFIGURED_WRITE_CONCERN)
+
+    if _CONFIGURED_READ_CONCERN is not None:
+        database = database.with_options(read_concern=_CONFIGURED_READ_CONCERN)
+
+    return database
+
+
 def get_database(database_name: Optional[str] = None) -> Database:
     """Get MongoDB database with read/write preferences.
-    
+
     Args:
         database_name: Name of the database, or None to use default
-        
+
     Returns:
         Database: MongoDB database instance
-    
+
     Raises:
         ValueError: If no database name is provided and no default is set
     """
-    client = get_client()
     db_name = database_name or MONGODB_DEFAULT_DB
-    
+
     if not db_name:
         raise ValueError("No database name provided and no default database set")
-    
-    # Get database with configured read/write preferences
-    database = client[db_name]
-    
-    # Apply read/write preferences if configured
-    from mongo_mcp.config import (
-        MONGODB_READ_PREFERENCE,
-        MONGODB_WRITE_CONCERN_W,
-        MONGODB_WRITE_CONCERN_J,
-        MONGODB_READ_CONCERN_LEVEL
-    )
-    
-    # Set read preference
-    if MONGODB_READ_PREFERENCE != "primary":
-        from pymongo.read_preferences import ReadPreference
-        read_pref_map = {
-            "secondary": ReadPreference.SECONDARY,
-            "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
-            "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
-            "nearest": ReadPreference.NEAREST
-        }
-        if MONGODB_READ_PREFERENCE in read_pref_map:
-            database = database.with_options(read_preference=read_pref_map[MONGODB_READ_PREFERENCE])
-    
-    # Set write concern
-    if MONGODB_WRITE_CONCERN_W != "1" or MONGODB_WRITE_CONCERN_J:
-        from pymongo.write_concern import WriteConcern
-        w_value = int(MONGODB_WRITE_CONCERN_W) if MONGODB_WRITE_CONCERN_W.isdigit() else MONGODB_WRITE_CONCERN_W
-        write_concern = WriteConcern(w=w_value, j=MONGODB_WRITE_CONCERN_J)
-        database = database.with_options(write_concern=write_concern)
-    
-    # Set read concern
-    if MONGODB_READ_CONCERN_LEVEL != "local":
-        from pymongo.read_concern import ReadConcern
-        read_concern = ReadConcern(level=MONGODB_READ_CONCERN_LEVEL)
-        database = database.with_options(read_concern=read_concern)
-    
-    return database
 
+    if not _HAS_NON_DEFAULT_PREFERENCES:
+        return get_client()[db_name]
+
+    return _build_database(db_name)
 
+
+@lru_cache(maxsize=256)
 def get_collection(database_name: str, collection_name: str) -> Collection:
     """Get MongoDB collection with configured preferences.
-    
+
+    Memoized per (database_name, collection_name) — Collection objects are
+    thread-safe and cheap to reuse, so hot tool loops skip re-resolution.
+    Cleared in close_connection() and when collections are dropped/renamed.
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
-        
+
     Returns:
         Collection: MongoDB collection instance
     """
@@ -154,27 +267,170 @@ def get_collection(database_name: str, collection_name: str) -> Collection:
     return db[collection_name]
 
 
+class _ObjectIdToStringDecoder(TypeDecoder):
+    """Decode ObjectIds straight to strings inside the C BSON codec path."""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+
+_JSON_SAFE_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    type_registry=TypeRegistry([_ObjectIdToStringDecoder()])
+)
+
+
+@lru_cache(maxsize=256)
+def get_json_safe_collection(database_name: str, collection_name: str) -> Collection:
+    """Get a collection whose reads decode ObjectIds as strings.
+
+    The type registry hooks BSON decoding, so results arrive with string ids
+    without a Python-level walk. Only the decode direction can be hooked —
+    str already has a built-in BSON encoding — so query-side id conversion
+    still happens in _convert_id_strings at the call sites.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+
+    Returns:
+        Collection: Collection instance with the JSON-safe codec options
+    """
+    db = get_database(database_name)
+    return db.get_collection(collection_name, codec_options=_JSON_SAFE_CODEC_OPTIONS)
+
+
+def _parallel_admin_bootstrap(client: MongoClient) -> Dict[str, Any]:
+    """Run the independent admin diagnostic commands concurrently.
+
+    ping, server_info, serverStatus and listDatabases have no ordering
+    dependency, so issuing them from a small thread pool overlaps their
+    network round-trips instead of paying them additively.
+
+    Args:
+        client: Connected MongoDB client
+
+    Returns:
+        Dict[str, Any]: ping, server_info, server_status and database_names results
+    """
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ping_future = pool.submit(client.admin.command, "ping")
+        info_future = pool.submit(get_static_server_info)
+        status_future = pool.submit(client.admin.command, _SERVER_STATUS_SUMMARY_CMD)
+        names_future = pool.submit(
+            lambda: [db["name"] for db in client.list_databases(nameOnly=True)]
+        )
+        return {
+            "ping": ping_future.result(),
+            "server_info": info_future.result()[0],
+            "server_status": status_future.result(),
+            "database_names": names_future.result(),
+        }
+
+
+def get_async_client() -> AsyncMongoClient:
+    """Get or initialize the async MongoDB client.
+
+    Uses PyMongo's native asynchronous API so concurrent tool calls overlap
+    their round-trips on the event loop instead of blocking worker threads.
+    Construction is lazy and does not connect; the first awaited operation
+    establishes the connection.
+
+    Returns:
+        AsyncMongoClient: Async MongoDB client instance
+    """
+    global _async_client
+    if _async_client is None:
+        connection_options = get_connection_options()
+        _async_client = AsyncMongoClient(MONGODB_URI, **connection_options)
+        logger.info("Initialized async MongoDB client")
+    return _async_client
+
+
+def get_async_database(database_name: Optional[str] = None) -> AsyncDatabase:
+    """Get async MongoDB database with read/write preferences.
+
+    Args:
+        database_name: Name of the database, or None to use default
+
+    Returns:
+        AsyncDatabase: Async MongoDB database instance
+
+    Raises:
+        ValueError: If no database name is provided and no default is set
+    """
+    db_name = database_name or MONGODB_DEFAULT_DB
+
+    if not db_name:
+        raise ValueError("No database name provided and no default database set")
+
+    database = get_async_client()[db_name]
+
+    if _CONFIGURED_READ_PREFERENCE is not None:
+        database = database.with_options(read_preference=_CONFIGURED_READ_PREFERENCE)
+    if _CONFIGURED_WRITE_CONCERN is not None:
+        database = database.with_options(write_concern=_CONFIGURED_WRITE_CONCERN)
+    if _CONFIGURED_READ_CONCERN is not None:
+        database = database.with_options(read_concern=_CONFIGURED_READ_CONCERN)
+
+    return database
+
+
+@lru_cache(maxsize=256)
+def get_async_collection(database_name: str, collection_name: str) -> AsyncCollection:
+    """Get async MongoDB collection with configured preferences.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+
+    Returns:
+        AsyncCollection: Async MongoDB collection instance
+    """
+    db = get_async_database(database_name)
+    return db[collection_name]
+
+
+async def close_async_connection() -> None:
+    """Close the async MongoDB connection and cleanup resources."""
+    global _async_client
+    if _async_client is not None:
+        logger.info("Closing async MongoDB connection")
+        try:
+            await _async_client.close()
+        except Exception as e:
+            logger.warning(f"Error closing async MongoDB connection: {e}")
+        finally:
+            _async_client = None
+            get_async_collection.cache_clear()
+
+
 def test_connection() -> Dict[str, Any]:
     """Test MongoDB connection and return connection details.
-    
+
     Returns:
         Dict[str, Any]: Connection test results
     """
     try:
         client = get_client()
-        
-        # Test basic connectivity
-        ping_result = client.admin.command("ping")
-        
-        # Get server information
-        server_info = client.server_info()
-        
-        # Get server status
-        server_status = client.admin.command("serverStatus")
-        
-        # Get database list
-        database_names = client.list_database_names()
-        
+
+        # Issue the diagnostic commands concurrently (one RTT instead of four)
+        bootstrap = _parallel_admin_bootstrap(client)
+        ping_result = bootstrap["ping"]
+        server_info = bootstrap["server_info"]
+        server_status = bootstrap["server_status"]
+        database_names = bootstrap["database_names"]
+
+        # Split user/system databases in one pass over the frozenset
+        user_databases = []
+        system_databases = []
+        for name in database_names:
+            if name in _SYSTEM_DBS:
+                system_databases.append(name)
+            else:
+                user_databases.append(name)
+
         result = {
             "connection_status": "healthy",
             "ping_ok": ping_result.get("ok") == 1,
@@ -188,8 +444,8 @@ def test_connection() -> Dict[str, Any]:
             },
             "databases": {
                 "total_count": len(database_names),
-                "user_databases": [db for db in database_names if db not in ['admin', 'local', 'config']],
-                "system_databases": [db for db in database_names if db in ['admin', 'local', 'config']]
+                "user_databases": user_databases,
+                "system_databases": system_databases
             }
         }
         
@@ -207,7 +463,8 @@ def test_connection() -> Dict[str, Any]:
 
 def close_connection() -> None:
     """Close the MongoDB connection and cleanup resources."""
-    global _client
+    global _client, _conninfo_cache
+    _conninfo_cache = None
     if _client is not None:
         logger.info("Closing MongoDB connection")
         try:
@@ -217,37 +474,54 @@ def close_connection() -> None:
             logger.warning(f"Error closing MongoDB connection: {e}")
         finally:
             _client = None
+            _static_server_info.cache_clear()
+            _build_database.cache_clear()
+            get_collection.cache_clear()
+            get_json_safe_collection.cache_clear()
 
 
 def get_connection_info() -> Dict[str, Any]:
     """Get current connection information.
-    
+
+    Reads the client's topology description instead of attributes like
+    .primary that can block on server selection, and caches the result for
+    a few seconds so repeated polling is free.
+
     Returns:
         Dict[str, Any]: Connection information
     """
-    global _client
+    global _conninfo_cache
     if _client is None:
         return {"status": "not_connected"}
-    
+
+    now = time.monotonic()
+    if _conninfo_cache is not None and now - _conninfo_cache[0] < _CONNINFO_TTL:
+        return _conninfo_cache[1]
+
     try:
         # Get connection options that were used
-        from mongo_mcp.config import get_connection_options
         options = get_connection_options()
-        
-        return {
+
+        # topology_description is a non-blocking snapshot of what the
+        # monitor threads currently know about each server
+        topology = _client.topology_description
+        servers = {
+            f"{address[0]}:{address[1]}": description.server_type_name
+            for address, description in topology.server_descriptions().items()
+        }
+
+        result = {
             "status": "connected",
             "uri": MONGODB_URI,
             "default_database": MONGODB_DEFAULT_DB,
             "connection_options": options,
             "client_info": {
-                "nodes": _client.nodes,
-                "primary": _client.primary,
-                "secondaries": list(_client.secondaries),
-                "arbiters": list(_client.arbiters),
-                "is_mongos": _client.is_mongos,
-                "is_primary": _client.is_primary,
+                "topology_type": topology.topology_type_name,
+                "servers": servers,
             }
         }
+        _conninfo_cache = (now, result)
+        return result
     except Exception as e:
         logger.error(f"Error getting connection info: {e}")
         return {
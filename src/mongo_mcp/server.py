@@ -20,24 +20,30 @@ from mongo_mcp.tools import (
     drop_collection,
     rename_collection,
     get_collection_stats,
-    
+    get_all_collection_stats,
+
     # Document CRUD operations
     insert_document,
     insert_many_documents,
+    bulk_write_documents,
     find_documents,
+    find_documents_json,
     find_one_document,
     count_documents,
     update_document,
     replace_document,
     delete_document,
-    
+    execute_many,
+
     # Index management tools
     list_indexes,
     create_index,
+    create_indexes_bulk,
     create_text_index,
     create_compound_index,
     drop_index,
     reindex_collection,
+    get_reindex_status,
     
     # Aggregation operations
     aggregate_documents,
@@ -50,7 +56,6 @@ from mongo_mcp.tools import (
     test_mongodb_connection,
     get_connection_details,
 )
-from mongo_mcp.utils.json_encoder import mongodb_json_serializer
 
 
 # Set up MCP server
@@ -71,21 +76,25 @@ def mcp_list_databases() -> List[str]:
     """
     return list_databases()
 
-@app.tool()  
-def mcp_list_collections(database_name: str) -> List[str]:
+@app.tool()
+def mcp_list_collections(
+    database_name: str,
+    filter: Optional[Dict[str, Any]] = None
+) -> List[str]:
     """List all collections in the specified database.
-    
+
     Args:
         database_name: Name of the database
-    
+        filter: Optional listCollections filter applied server-side
+
     Returns:
         List[str]: List of collection names
-    
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If database name is not provided
     """
-    return list_collections(database_name)
+    return list_collections(database_name, filter)
 
 @app.tool()
 def mcp_create_database(
@@ -221,6 +230,22 @@ def mcp_get_collection_stats(database_name: str, collection_name: str) -> Dict[s
     """
     return get_collection_stats(database_name, collection_name)
 
+@app.tool()
+def mcp_get_all_collection_stats(database_name: str) -> List[Dict[str, Any]]:
+    """Get statistics for every collection in a database in one call.
+
+    Args:
+        database_name: Name of the database
+
+    Returns:
+        List[Dict[str, Any]]: Statistics for each collection
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If database name is not provided
+    """
+    return get_all_collection_stats(database_name)
+
 # Document CRUD operations
 @app.tool()
 def mcp_insert_document(
@@ -249,25 +274,54 @@ def mcp_insert_many_documents(
     database_name: str,
     collection_name: str,
     documents: List[Dict[str, Any]],
-    ordered: bool = True
+    ordered: bool = False
 ) -> Dict[str, Any]:
     """Insert multiple documents into the specified collection.
-    
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
         documents: List of documents to insert
         ordered: Whether to perform ordered or unordered inserts
-    
+
     Returns:
         Dict[str, Any]: Result containing the inserted document IDs
-    
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
     return insert_many_documents(database_name, collection_name, documents, ordered)
 
+@app.tool()
+def mcp_bulk_write_documents(
+    database_name: str,
+    collection_name: str,
+    operations: List[Dict[str, Any]],
+    ordered: bool = False
+) -> Dict[str, Any]:
+    """Execute a mixed batch of write operations in a single round-trip.
+
+    Each operation is a dictionary with a "type" key (insert_one,
+    update_one, update_many, replace_one, delete_one, delete_many) plus
+    the arguments that operation needs ("document", "filter", "update",
+    "replacement", optional "upsert").
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        operations: List of operation dictionaries
+        ordered: Whether to stop at the first failure
+
+    Returns:
+        Dict[str, Any]: Counts from the bulk write result
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing or an operation is malformed
+    """
+    return bulk_write_documents(database_name, collection_name, operations, ordered)
+
 @app.tool()
 def mcp_find_documents(
     database_name: str,
@@ -296,6 +350,38 @@ def mcp_find_documents(
     """
     return find_documents(database_name, collection_name, query, projection, limit, sort)
 
+@app.tool()
+def mcp_find_documents_json(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    limit: int = 0,
+    sort: Optional[Dict[str, Any]] = None
+) -> str:
+    """Find documents and return them as a relaxed Extended JSON string.
+    
+    Serialization runs in the C BSON extension, so this is the fast path
+    for large result sets; BSON types keep their Extended JSON form
+    (e.g. _id becomes {"$oid": "..."}).
+    
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        projection: MongoDB projection (fields to include/exclude)
+        limit: Maximum number of documents to return (0 for no limit)
+        sort: MongoDB sort specification
+    
+    Returns:
+        str: JSON array of matching documents in relaxed Extended JSON
+    
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    return find_documents_json(database_name, collection_name, query, projection, limit, sort)
+
 @app.tool()
 def mcp_find_one_document(
     database_name: str,
@@ -420,15 +506,42 @@ def mcp_delete_document(
     """
     return delete_document(database_name, collection_name, query, delete_many)
 
+@app.tool()
+async def mcp_execute_many(operations: List[Dict[str, Any]]) -> List[Any]:
+    """Run several document operations concurrently.
+
+    Each operation is a dictionary with a "type" key naming one of the
+    document tools (insert_document, find_documents, find_one_document,
+    count_documents, update_document, delete_document) plus that tool's
+    keyword arguments.
+
+    Args:
+        operations: List of operation dictionaries
+
+    Returns:
+        List[Any]: Per-operation results, in submission order
+
+    Raises:
+        PyMongoError: If any operation fails
+        ValueError: If an operation is malformed
+    """
+    return await execute_many(operations)
+
 # Index management tools
 @app.tool()
-def mcp_list_indexes(database_name: str, collection_name: str) -> List[Dict[str, Any]]:
+def mcp_list_indexes(
+    database_name: str,
+    collection_name: str,
+    fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """List all indexes for the specified collection.
     
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
-    
+        fields: Optional list of cleaned field names (e.g. ["name", "key"])
+            to return per index; None returns everything
+
     Returns:
         List[Dict[str, Any]]: List of index information
     
@@ -436,7 +549,7 @@ def mcp_list_indexes(database_name: str, collection_name: str) -> List[Dict[str,
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    return list_indexes(database_name, collection_name)
+    return list_indexes(database_name, collection_name, fields)
 
 @app.tool()
 def mcp_create_index(
@@ -462,6 +575,29 @@ def mcp_create_index(
     """
     return create_index(database_name, collection_name, keys, options)
 
+@app.tool()
+def mcp_create_indexes_bulk(
+    database_name: str,
+    collection_name: str,
+    index_specs: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Create several indexes in one createIndexes command.
+    
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        index_specs: List of index specifications, each a dict with a "keys"
+            mapping (as accepted by mcp_create_index) and optional "options"
+    
+    Returns:
+        Dict[str, Any]: Names of the created indexes
+    
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    return create_indexes_bulk(database_name, collection_name, index_specs)
+
 @app.tool()
 def mcp_create_text_index(
     database_name: str,
@@ -491,7 +627,9 @@ def mcp_create_compound_index(
     database_name: str,
     collection_name: str,
     field_specs: List[Tuple[str, Any]],
-    options: Optional[Dict[str, Any]] = None
+    options: Optional[Dict[str, Any]] = None,
+    hint_query: Optional[Dict[str, Any]] = None,
+    auto_reorder: bool = False
 ) -> Dict[str, Any]:
     """Create a compound index on multiple fields.
     
@@ -500,6 +638,10 @@ def mcp_create_compound_index(
         collection_name: Name of the collection
         field_specs: List of (field_name, direction) tuples
         options: Index options (unique, sparse, background, etc.)
+        hint_query: Representative query as {"filter": {...}, "sort": [...]}
+            used to advise on Equality-Sort-Range field ordering
+        auto_reorder: If True, rebuild field_specs in ESR order instead of
+            only warning
     
     Returns:
         Dict[str, Any]: Result of the index creation
@@ -508,7 +650,9 @@ def mcp_create_compound_index(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    return create_compound_index(database_name, collection_name, field_specs, options)
+    return create_compound_index(
+        database_name, collection_name, field_specs, options, hint_query, auto_reorder
+    )
 
 @app.tool()
 def mcp_drop_index(
@@ -533,21 +677,43 @@ def mcp_drop_index(
     return drop_index(database_name, collection_name, index_name)
 
 @app.tool()
-def mcp_reindex_collection(database_name: str, collection_name: str) -> Dict[str, Any]:
+def mcp_reindex_collection(
+    database_name: str,
+    collection_name: str,
+    background: bool = False
+) -> Dict[str, Any]:
     """Rebuild all indexes for the specified collection.
     
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
+        background: If True, run the rebuild in the background and return a
+            job id immediately; poll with mcp_get_reindex_status
     
     Returns:
-        Dict[str, Any]: Result of the reindex operation
+        Dict[str, Any]: Result of the reindex operation, or the job handle
+            when run in the background
     
     Raises:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    return reindex_collection(database_name, collection_name)
+    return reindex_collection(database_name, collection_name, background)
+
+@app.tool()
+def mcp_get_reindex_status(job_id: str) -> Dict[str, Any]:
+    """Check the state of a background reindex job.
+    
+    Args:
+        job_id: Job identifier returned by mcp_reindex_collection
+    
+    Returns:
+        Dict[str, Any]: Job status; includes the reIndex result once finished
+    
+    Raises:
+        ValueError: If the job id is unknown or missing
+    """
+    return get_reindex_status(job_id)
 
 # Aggregation operations
 @app.tool()
@@ -674,24 +840,30 @@ mongo_tools = [
     mcp_drop_collection,
     mcp_rename_collection,
     mcp_get_collection_stats,
+    mcp_get_all_collection_stats,
     
     # Document CRUD operations
     mcp_insert_document,
     mcp_insert_many_documents,
+    mcp_bulk_write_documents,
     mcp_find_documents,
+    mcp_find_documents_json,
     mcp_find_one_document,
     mcp_count_documents,
     mcp_update_document,
     mcp_replace_document,
     mcp_delete_document,
+    mcp_execute_many,
     
     # Index management tools
     mcp_list_indexes,
     mcp_create_index,
+    mcp_create_indexes_bulk,
     mcp_create_text_index,
     mcp_create_compound_index,
     mcp_drop_index,
     mcp_reindex_collection,
+    mcp_get_reindex_status,
     
     # Aggregation operations
     mcp_aggregate_documents,
@@ -2,7 +2,9 @@
 
 from mongo_mcp.tools.database_tools import (
     list_databases,
+    list_databases_async,
     list_collections,
+    list_collections_async,
     create_database,
     drop_database,
     get_database_stats,
@@ -10,28 +12,43 @@ from mongo_mcp.tools.database_tools import (
     drop_collection,
     rename_collection,
     get_collection_stats,
+    get_all_collection_stats,
 )
 from mongo_mcp.tools.document_tools import (
     insert_document,
+    insert_document_async,
     insert_many_documents,
+    bulk_write_documents,
     find_documents,
+    find_documents_async,
+    find_documents_json,
     find_one_document,
+    find_one_document_async,
     count_documents,
+    count_documents_async,
     update_document,
+    update_document_async,
     replace_document,
     delete_document,
+    delete_document_async,
+    execute_many,
 )
 from mongo_mcp.tools.index_tools import (
     list_indexes,
+    iter_indexes,
     create_index,
+    create_indexes_bulk,
     create_text_index,
     create_compound_index,
     drop_index,
     reindex_collection,
+    get_reindex_status,
 )
 from mongo_mcp.tools.aggregation_tools import (
     aggregate_documents,
+    aggregate_documents_async,
     distinct_values,
+    distinct_values_async,
 )
 from mongo_mcp.tools.admin_tools import (
     get_server_status,
@@ -44,7 +61,9 @@ from mongo_mcp.tools.admin_tools import (
 __all__ = [
     # Database management tools
     "list_databases",
+    "list_databases_async",
     "list_collections",
+    "list_collections_async",
     "create_database",
     "drop_database",
     "get_database_stats",
@@ -52,28 +71,43 @@ __all__ = [
     "drop_collection",
     "rename_collection",
     "get_collection_stats",
+    "get_all_collection_stats",
     
     # Document CRUD operations
     "insert_document",
+    "insert_document_async",
     "insert_many_documents",
+    "bulk_write_documents",
     "find_documents",
+    "find_documents_async",
+    "find_documents_json",
     "find_one_document",
+    "find_one_document_async",
     "count_documents",
+    "count_documents_async",
     "update_document",
+    "update_document_async",
     "replace_document",
     "delete_document",
+    "delete_document_async",
+    "execute_many",
     
     # Index management tools
     "list_indexes",
+    "iter_indexes",
     "create_index",
+    "create_indexes_bulk",
     "create_text_index",
     "create_compound_index",
     "drop_index",
     "reindex_collection",
+    "get_reindex_status",
     
     # Aggregation operations
     "aggregate_documents",
+    "aggregate_documents_async",
     "distinct_values",
+    "distinct_values_async",
     
     # Administrative and monitoring tools
     "get_server_status",
@@ -3,8 +3,42 @@
 from typing import Dict, Any, Optional
 from pymongo.errors import PyMongoError, OperationFailure
 
-from mongo_mcp.db import get_client, get_database, test_connection, get_connection_info
+from mongo_mcp.db import (
+    get_client,
+    get_database,
+    get_static_server_info,
+    test_connection,
+    get_connection_info,
+)
 from mongo_mcp.config import logger
+from mongo_mcp.utils.json_encoder import clean_document_for_json
+
+# serverStatus sections suppressed server-side — get_server_status only
+# reads the summary fields, so the heavy sections (often 100+ KB combined)
+# would cross the wire just to be discarded
+# Stable server error codes meaning "not a replica set":
+# NoReplicationEnabled (76), InvalidReplicaSetConfig (93), NotYetInitialized (94)
+_NOT_REPLICA_SET_CODES = frozenset({76, 93, 94})
+
+_SERVER_STATUS_CMD = {
+    "serverStatus": 1,
+    "asserts": 0,
+    "metrics": 0,
+    "wiredTiger": 0,
+    "tcmalloc": 0,
+    "locks": 0,
+    "logicalSessionRecordCache": 0,
+    "transactions": 0,
+    "repl": 0,
+    "storageEngine": 0,
+    "transportSecurity": 0,
+}
+
+
+def _put(target: Dict[str, Any], key: str, value: Any) -> None:
+    """Insert a key only when the value is not None."""
+    if value is not None:
+        target[key] = value
 
 
 def get_server_status() -> Dict[str, Any]:
@@ -18,7 +52,7 @@ def get_server_status() -> Dict[str, Any]:
     """
     try:
         client = get_client()
-        status = client.admin.command("serverStatus")
+        status = client.admin.command(_SERVER_STATUS_CMD)
         
         # Extract relevant information and clean for JSON serialization
         clean_status = {
@@ -76,16 +110,21 @@ def get_replica_set_status() -> Optional[Dict[str, Any]]:
         try:
             status = client.admin.command("replSetGetStatus")
         except OperationFailure as e:
-            if "not running with --replSet" in str(e) or "not a member of a replica set" in str(e):
+            # Check the stable error code rather than matching on the message,
+            # which formats the whole error envelope and is locale-fragile
+            if e.code in _NOT_REPLICA_SET_CODES:
                 logger.info("MongoDB instance is not part of a replica set")
                 return None
             else:
                 raise
         
-        # Clean replica set status for JSON serialization
+        # One encoder pass converts every BSON timestamp/date up front, so the
+        # field picks below don't need per-field str() wrapping
+        status = clean_document_for_json(status)
+
         clean_status = {
             "set": status.get("set"),
-            "date": str(status.get("date")),
+            "date": status.get("date"),
             "my_state": status.get("myState"),
             "term": status.get("term"),
             "sync_source_host": status.get("syncSourceHost"),
@@ -98,36 +137,28 @@ def get_replica_set_status() -> Optional[Dict[str, Any]]:
             "members": []
         }
         
-        # Process members information
+        # Process members information, inserting only present values so no
+        # second filter pass (and dict copy) is needed
         for member in status.get("members", []):
-            clean_member = {
-                "_id": member.get("_id"),
-                "name": member.get("name"),
-                "health": member.get("health"),
-                "state": member.get("state"),
-                "state_str": member.get("stateStr"),
-                "uptime": member.get("uptime"),
-                "optime": {
-                    "ts": str(member.get("optime", {}).get("ts")),
-                    "t": member.get("optime", {}).get("t")
-                },
-                "optimeDurable": {
-                    "ts": str(member.get("optimeDurable", {}).get("ts")),
-                    "t": member.get("optimeDurable", {}).get("t")
-                },
-                "last_heartbeat": str(member.get("lastHeartbeat")),
-                "last_heartbeat_recv": str(member.get("lastHeartbeatRecv")),
-                "ping_ms": member.get("pingMs"),
-                "sync_source_host": member.get("syncSourceHost"),
-                "sync_source_id": member.get("syncSourceId"),
-                "info_message": member.get("infoMessage"),
-                "election_time": str(member.get("electionTime")),
-                "election_date": str(member.get("electionDate")),
-                "config_version": member.get("configVersion"),
-                "config_term": member.get("configTerm")
-            }
-            # Remove None values
-            clean_member = {k: v for k, v in clean_member.items() if v is not None and v != "None"}
+            clean_member: Dict[str, Any] = {}
+            _put(clean_member, "_id", member.get("_id"))
+            _put(clean_member, "name", member.get("name"))
+            _put(clean_member, "health", member.get("health"))
+            _put(clean_member, "state", member.get("state"))
+            _put(clean_member, "state_str", member.get("stateStr"))
+            _put(clean_member, "uptime", member.get("uptime"))
+            _put(clean_member, "optime", member.get("optime"))
+            _put(clean_member, "optimeDurable", member.get("optimeDurable"))
+            _put(clean_member, "last_heartbeat", member.get("lastHeartbeat"))
+            _put(clean_member, "last_heartbeat_recv", member.get("lastHeartbeatRecv"))
+            _put(clean_member, "ping_ms", member.get("pingMs"))
+            _put(clean_member, "sync_source_host", member.get("syncSourceHost"))
+            _put(clean_member, "sync_source_id", member.get("syncSourceId"))
+            _put(clean_member, "info_message", member.get("infoMessage"))
+            _put(clean_member, "election_time", member.get("electionTime"))
+            _put(clean_member, "election_date", member.get("electionDate"))
+            _put(clean_member, "config_version", member.get("configVersion"))
+            _put(clean_member, "config_term", member.get("configTerm"))
             clean_status["members"].append(clean_member)
         
         logger.info(f"Retrieved replica set status for set '{clean_status['set']}'")
@@ -175,15 +206,16 @@ def ping_database(database_name: Optional[str] = None) -> Dict[str, Any]:
             ping_result = client.admin.command("ping")
             db_info = {}
         
-        # Get basic server information
+        # Get basic server information (hello is static per connection, so cached)
         try:
-            is_master = client.admin.command("hello")  # Updated from deprecated 'isMaster'
+            _, is_master = get_static_server_info()
+            is_master = clean_document_for_json(is_master)
             server_info = {
                 "is_writable_primary": is_master.get("isWritablePrimary", is_master.get("isMaster")),
                 "max_bson_object_size": is_master.get("maxBsonObjectSize"),
                 "max_message_size_bytes": is_master.get("maxMessageSizeBytes"),
                 "max_write_batch_size": is_master.get("maxWriteBatchSize"),
-                "local_time": str(is_master.get("localTime")),
+                "local_time": is_master.get("localTime"),
                 "log_component_verbosity": is_master.get("logComponentVerbosity"),
                 "min_wire_version": is_master.get("minWireVersion"),
                 "max_wire_version": is_master.get("maxWireVersion"),
@@ -192,9 +224,10 @@ def ping_database(database_name: Optional[str] = None) -> Dict[str, Any]:
         except PyMongoError:
             server_info = {"error": "Could not retrieve server info"}
         
+        ping_result = clean_document_for_json(ping_result)
         result = {
             "ping_ok": ping_result.get("ok") == 1,
-            "timestamp": str(ping_result.get("operationTime")),
+            "timestamp": ping_result.get("operationTime"),
             "server_info": server_info,
             "connection_status": "healthy"
         }
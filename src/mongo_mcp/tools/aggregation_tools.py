@@ -1,14 +1,92 @@
 """Aggregation operation tools for MongoDB."""
 
+import copy
+import re
 from typing import List, Dict, Any, Optional
 from pymongo.errors import PyMongoError
 from bson.objectid import ObjectId
 
-from mongo_mcp.db import get_collection
+from mongo_mcp.db import get_collection, get_async_collection
 from mongo_mcp.config import logger
 from mongo_mcp.utils.json_encoder import clean_document_for_json
+from mongo_mcp.utils.validation import require_args
 
+# Compiled once — C-speed check for a 24-char ObjectId hex string
+_OID_HEX_MATCH = re.compile(r"[0-9a-fA-F]{24}\Z").match
 
+# Stage prepended when callers opt into server-side id stringification via
+# options={"stringify_ids": True} — $toString runs in C++ on the server
+_STRINGIFY_ID_STAGE = {"$addFields": {"_id": {"$toString": "$_id"}}}
+
+# Expression operators whose output is always a JSON-safe scalar. Projected
+# field paths ({"field": 1}) are NOT safe: they pass raw BSON values through.
+_JSON_SAFE_EXPR_OPS = frozenset({"$toString", "$toInt", "$toLong", "$toDouble", "$toBool"})
+
+# Accumulators that only ever produce JSON-safe numbers
+_JSON_SAFE_ACCUMULATORS = frozenset({"$sum", "$avg", "$count", "$stdDevPop", "$stdDevSamp"})
+
+
+def _is_json_safe_expression(value: Any) -> bool:
+    """Check whether a projection value is a scalar-producing expression."""
+    return (
+        isinstance(value, dict)
+        and len(value) == 1
+        and next(iter(value)) in _JSON_SAFE_EXPR_OPS
+    )
+
+
+def _projects_json_safe_results(pipeline: List[Dict[str, Any]]) -> bool:
+    """Check whether the final pipeline stage guarantees JSON-safe documents.
+
+    Recognizes a trailing $project that excludes _id and computes every other
+    field through a scalar-producing expression ($toString and friends), and
+    a trailing $group whose _id is produced by $toString and whose
+    accumulators only produce numbers. Anything that can pass raw BSON values
+    through — included field paths, $first/$last/$push accumulators — keeps
+    the per-document cleanup pass.
+
+    Args:
+        pipeline: Aggregation pipeline to inspect
+
+    Returns:
+        bool: True when clean_document_for_json can be bypassed
+    """
+    if not pipeline:
+        return False
+    last = pipeline[-1]
+    if not isinstance(last, dict) or len(last) != 1:
+        return False
+    stage, spec = next(iter(last.items()))
+    if not isinstance(spec, dict):
+        return False
+    if stage == "$project":
+        if spec.get("_id") not in (0, False):
+            return False
+        # At least one computed field is required: {"$project": {"_id": 0}}
+        # alone is an exclusion projection that passes every other field raw
+        if len(spec) < 2:
+            return False
+        return all(
+            key == "_id" or _is_json_safe_expression(value)
+            for key, value in spec.items()
+        )
+    if stage == "$group":
+        group_id = spec.get("_id")
+        if not _is_json_safe_expression(group_id):
+            return False
+        return all(
+            key == "_id"
+            or (
+                isinstance(value, dict)
+                and len(value) == 1
+                and next(iter(value)) in _JSON_SAFE_ACCUMULATORS
+            )
+            for key, value in spec.items()
+        )
+    return False
+
+
+@require_args("database_name", "collection_name")
 def aggregate_documents(
     database_name: str,
     collection_name: str,
@@ -30,11 +108,6 @@ def aggregate_documents(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(pipeline, list):
         msg = "Pipeline must be a list of stage dictionaries"
         logger.error(msg)
@@ -42,22 +115,27 @@ def aggregate_documents(
     
     try:
         collection = get_collection(database_name, collection_name)
-        
+
         # Convert ObjectId strings in pipeline stages if present
         processed_pipeline = _convert_pipeline_objectids(pipeline)
-        
-        # Execute aggregation
-        if options:
-            cursor = collection.aggregate(processed_pipeline, **options)
+
+        # Execute aggregation with a large batch size to cut getMore round-trips,
+        # and allow disk use so large pipelines don't hit the memory limit
+        agg_options = dict(options) if options else {}
+        if agg_options.pop("stringify_ids", False):
+            processed_pipeline = [*processed_pipeline, _STRINGIFY_ID_STAGE]
+        agg_options.setdefault("batchSize", 1000)
+        agg_options.setdefault("allowDiskUse", True)
+        cursor = collection.aggregate(processed_pipeline, **agg_options)
+
+        # Materialize in a single comprehension so list building stays at C
+        # level; skip the per-document cleanup when the final stage already
+        # guarantees JSON-safe output
+        if _projects_json_safe_results(processed_pipeline):
+            results = list(cursor)
         else:
-            cursor = collection.aggregate(processed_pipeline)
-        
-        # Process results
-        results = []
-        for doc in cursor:
-            cleaned_doc = clean_document_for_json(doc)
-            results.append(cleaned_doc)
-        
+            results = [clean_document_for_json(doc) for doc in cursor]
+
         logger.info(f"Executed aggregation pipeline with {len(results)} results in {database_name}.{collection_name}")
         return results
     except PyMongoError as e:
@@ -65,6 +143,7 @@ def aggregate_documents(
         raise
 
 
+@require_args("database_name", "collection_name", "field")
 def distinct_values(
     database_name: str,
     collection_name: str,
@@ -86,16 +165,16 @@ def distinct_values(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name or not field:
-        msg = "Database name, collection name, and field must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         collection = get_collection(database_name, collection_name)
         
-        # Convert ObjectId strings in query if present
-        if query:
+        # Convert ObjectId strings in query only when a top-level value is an
+        # ObjectId-shaped string or a nested container that could hold one —
+        # plain scalar filters skip the walk entirely
+        if query and any(
+            isinstance(v, (dict, list)) or (type(v) is str and len(v) == 24 and _OID_HEX_MATCH(v))
+            for v in query.values()
+        ):
             query = _convert_id_strings(query)
         
         # Get distinct values
@@ -104,16 +183,125 @@ def distinct_values(
         else:
             distinct_vals = collection.distinct(field)
         
-        # Clean results for JSON serialization
-        cleaned_vals = []
-        for val in distinct_vals:
-            if isinstance(val, ObjectId):
-                cleaned_vals.append(str(val))
-            elif isinstance(val, dict):
-                cleaned_vals.append(clean_document_for_json(val))
-            else:
-                cleaned_vals.append(val)
-        
+        # Clean results for JSON serialization. Distinct values are almost
+        # always homogeneous, so dispatch on the first non-None value's type —
+        # but verify homogeneity with all() so mixed fields (legacy string ids
+        # alongside ObjectIds, scalars plus embedded docs) still get cleaned.
+        sample = next((v for v in distinct_vals if v is not None), None)
+        if sample is None or (
+            type(sample) in (str, int, float, bool)
+            and all(v is None or type(v) in (str, int, float, bool) for v in distinct_vals)
+        ):
+            cleaned_vals = distinct_vals
+        elif type(sample) is ObjectId and all(type(v) is ObjectId for v in distinct_vals):
+            cleaned_vals = list(map(str, distinct_vals))
+        else:
+            cleaned_vals = []
+            for val in distinct_vals:
+                if isinstance(val, ObjectId):
+                    cleaned_vals.append(str(val))
+                elif isinstance(val, dict):
+                    cleaned_vals.append(clean_document_for_json(val))
+                else:
+                    cleaned_vals.append(val)
+
+        logger.info(f"Found {len(cleaned_vals)} distinct values for field '{field}' in {database_name}.{collection_name}")
+        return cleaned_vals
+    except PyMongoError as e:
+        logger.error(f"Failed to get distinct values for field '{field}' in {database_name}.{collection_name}: {e}")
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def aggregate_documents_async(
+    database_name: str,
+    collection_name: str,
+    pipeline: List[Dict[str, Any]],
+    options: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Async variant of aggregate_documents for concurrent tool calls.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        pipeline: MongoDB aggregation pipeline (list of stage dictionaries)
+        options: Aggregation options (allowDiskUse, maxTimeMS, etc.)
+
+    Returns:
+        List[Dict[str, Any]]: Aggregation results
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(pipeline, list):
+        msg = "Pipeline must be a list of stage dictionaries"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+        processed_pipeline = _convert_pipeline_objectids(pipeline)
+
+        agg_options = dict(options) if options else {}
+        if agg_options.pop("stringify_ids", False):
+            processed_pipeline = [*processed_pipeline, _STRINGIFY_ID_STAGE]
+        agg_options.setdefault("batchSize", 1000)
+        agg_options.setdefault("allowDiskUse", True)
+        cursor = await collection.aggregate(processed_pipeline, **agg_options)
+
+        if _projects_json_safe_results(processed_pipeline):
+            results = [doc async for doc in cursor]
+        else:
+            results = [clean_document_for_json(doc) async for doc in cursor]
+
+        logger.info(f"Executed aggregation pipeline with {len(results)} results in {database_name}.{collection_name}")
+        return results
+    except PyMongoError as e:
+        logger.error(f"Failed to execute aggregation pipeline in {database_name}.{collection_name}: {e}")
+        raise
+
+
+@require_args("database_name", "collection_name", "field")
+async def distinct_values_async(
+    database_name: str,
+    collection_name: str,
+    field: str,
+    query: Optional[Dict[str, Any]] = None
+) -> List[Any]:
+    """Async variant of distinct_values for concurrent tool calls.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        field: Field name to get distinct values for
+        query: Optional query filter to limit documents
+
+    Returns:
+        List[Any]: List of distinct values
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if query:
+            query = _convert_id_strings(query)
+
+        if query:
+            distinct_vals = await collection.distinct(field, query)
+        else:
+            distinct_vals = await collection.distinct(field)
+
+        cleaned_vals = [
+            str(val) if isinstance(val, ObjectId)
+            else clean_document_for_json(val) if isinstance(val, dict)
+            else val
+            for val in distinct_vals
+        ]
+
         logger.info(f"Found {len(cleaned_vals)} distinct values for field '{field}' in {database_name}.{collection_name}")
         return cleaned_vals
     except PyMongoError as e:
@@ -121,44 +309,65 @@ def distinct_values(
         raise
 
 
-def _convert_pipeline_objectids(pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def _convert_pipeline_objectids(
+    pipeline: List[Dict[str, Any]],
+    mutate: bool = True
+) -> List[Dict[str, Any]]:
     """Convert ObjectId strings in aggregation pipeline stages.
-    
+
+    All stages are walked in a single pass by seeding the conversion stack
+    with the whole pipeline, avoiding a per-stage traversal. Pipelines
+    arriving over MCP are deserialized per request, so this module owns them
+    and converts in place by default.
+
     Args:
         pipeline: Aggregation pipeline to process
-        
+        mutate: Whether the caller cedes ownership; pass False to work on a copy
+
     Returns:
         List[Dict[str, Any]]: Processed pipeline with ObjectIds converted
     """
-    processed_pipeline = []
-    
-    for stage in pipeline:
-        if isinstance(stage, dict):
-            processed_stage = _convert_id_strings(stage)
-            processed_pipeline.append(processed_stage)
-        else:
-            processed_pipeline.append(stage)
-    
-    return processed_pipeline
+    return _convert_id_strings(pipeline, mutate=mutate)
 
 
-def _convert_id_strings(obj: Any) -> Any:
-    """Recursively convert ObjectId strings to ObjectId objects.
-    
+def _convert_id_strings(obj: Any, mutate: bool = True) -> Any:
+    """Convert ObjectId strings to ObjectId objects, in place.
+
+    Uses an explicit stack instead of recursion and pre-filters candidate
+    strings by length before the full ObjectId.is_valid check, so deeply
+    nested payloads with many non-id strings stay cheap.
+
     Args:
-        obj: Object to process
-        
+        obj: Object to process (mutated in place for dicts/lists)
+        mutate: When False the input is deep-copied first, for callers that
+            don't own the payload
+
     Returns:
         Any: Processed object with ObjectIds converted
     """
-    if isinstance(obj, dict):
-        converted = {}
-        for key, value in obj.items():
-            converted[key] = _convert_id_strings(value)
-        return converted
-    elif isinstance(obj, list):
-        return [_convert_id_strings(item) for item in obj]
-    elif isinstance(obj, str) and ObjectId.is_valid(obj):
-        return ObjectId(obj)
-    else:
-        return obj 
\ No newline at end of file
+    if type(obj) is str:
+        return ObjectId(obj) if len(obj) == 24 and ObjectId.is_valid(obj) else obj
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    if not mutate:
+        obj = copy.deepcopy(obj)
+
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        if type(container) is dict:
+            for key, value in container.items():
+                if type(value) is str:
+                    if len(value) == 24 and ObjectId.is_valid(value):
+                        container[key] = ObjectId(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        else:
+            for i, value in enumerate(container):
+                if type(value) is str:
+                    if len(value) == 24 and ObjectId.is_valid(value):
+                        container[i] = ObjectId(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+    return obj 
\ No newline at end of file
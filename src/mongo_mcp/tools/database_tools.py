@@ -1,12 +1,35 @@
 """Database-level operation tools for MongoDB."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pymongo.errors import PyMongoError
 
-from mongo_mcp.db import get_client, get_database
-from mongo_mcp.config import logger
+from mongo_mcp.db import (
+    get_client,
+    get_database,
+    get_collection,
+    get_json_safe_collection,
+    get_async_client,
+    get_async_database,
+)
+from mongo_mcp.config import logger, METADATA_CACHE_TTL
+from mongo_mcp.tools.index_tools import _invalidate_index_cache
+from mongo_mcp.utils.ttl_cache import ttl_cache
+from mongo_mcp.utils.validation import require_args
 
+# Server-side filter excluding system databases from listDatabases results
+_USER_DB_FILTER = {"name": {"$nin": ["admin", "local", "config"]}}
 
+
+def _invalidate_metadata_caches() -> None:
+    """Drop cached metadata reads after a structure-changing operation."""
+    list_databases.cache_clear()
+    list_collections.cache_clear()
+    get_database_stats.cache_clear()
+    get_collection_stats.cache_clear()
+
+
+@ttl_cache(ttl=METADATA_CACHE_TTL)
 def list_databases() -> List[str]:
     """List all databases in the MongoDB instance.
     
@@ -18,47 +41,99 @@ def list_databases() -> List[str]:
     """
     try:
         client = get_client()
-        # Filter out system databases
+        # nameOnly skips server-side size computation and the filter pushes
+        # the system-database exclusion down to the server
         db_names = [
-            db["name"] 
-            for db in client.list_databases() 
-            if db["name"] not in ["admin", "local", "config"]
+            db["name"]
+            for db in client.list_databases(nameOnly=True, filter=_USER_DB_FILTER)
         ]
-        logger.info(f"Listed {len(db_names)} databases")
+        logger.info("Listed %s databases", len(db_names))
         return db_names
     except PyMongoError as e:
-        logger.error(f"Failed to list databases: {e}")
+        logger.error("Failed to list databases: %s", e)
         raise
 
 
-def list_collections(database_name: str) -> List[str]:
+@require_args("database_name")
+@ttl_cache(ttl=METADATA_CACHE_TTL)
+def list_collections(
+    database_name: str,
+    filter: Optional[Dict[str, Any]] = None
+) -> List[str]:
     """List all collections in the specified database.
-    
+
     Args:
         database_name: Name of the database
-    
+        filter: Optional listCollections filter applied server-side
+            (e.g. {"name": {"$regex": "^logs_"}}), avoiding transfer of
+            the full namespace list
+
     Returns:
         List[str]: List of collection names
-    
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If database name is not provided
     """
-    if not database_name:
-        msg = "Database name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-        
     try:
         db = get_database(database_name)
-        collection_names = db.list_collection_names()
-        logger.info(f"Listed {len(collection_names)} collections in database '{database_name}'")
+        collection_names = db.list_collection_names(filter=filter)
+        logger.info("Listed %s collections in database '%s'", len(collection_names), database_name)
+        return collection_names
+    except PyMongoError as e:
+        logger.error("Failed to list collections in database '%s': %s", database_name, e)
+        raise
+
+
+async def list_databases_async() -> List[str]:
+    """Async variant of list_databases.
+
+    Returns:
+        List[str]: List of database names
+
+    Raises:
+        PyMongoError: If the operation fails
+    """
+    try:
+        client = get_async_client()
+        db_names = [
+            db["name"]
+            async for db in await client.list_databases(
+                nameOnly=True, filter=_USER_DB_FILTER
+            )
+        ]
+        logger.info("Listed %s databases", len(db_names))
+        return db_names
+    except PyMongoError as e:
+        logger.error("Failed to list databases: %s", e)
+        raise
+
+
+@require_args("database_name")
+async def list_collections_async(database_name: str) -> List[str]:
+    """Async variant of list_collections.
+
+    Args:
+        database_name: Name of the database
+
+    Returns:
+        List[str]: List of collection names
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If database name is not provided
+    """
+    try:
+        db = get_async_database(database_name)
+        collection_names = await db.list_collection_names()
+        logger.info("Listed %s collections in database '%s'", len(collection_names), database_name)
         return collection_names
     except PyMongoError as e:
-        logger.error(f"Failed to list collections in database '{database_name}': {e}")
+        logger.error("Failed to list collections in database '%s': %s", database_name, e)
         raise
 
 
+@require_args("database_name")
 def create_database(
     database_name: str, 
     initial_collection: str = "init", 
@@ -80,11 +155,6 @@ def create_database(
         PyMongoError: If the operation fails
         ValueError: If database name is not provided
     """
-    if not database_name:
-        msg = "Database name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if initial_document is None:
         initial_document = {"_created": "Database initialization document"}
     
@@ -92,8 +162,9 @@ def create_database(
         db = get_database(database_name)
         collection = db[initial_collection]
         result = collection.insert_one(initial_document)
-        
-        logger.info(f"Created database '{database_name}' with initial collection '{initial_collection}'")
+        _invalidate_metadata_caches()
+
+        logger.info("Created database '%s' with initial collection '%s'", database_name, initial_collection)
         return {
             "database_name": database_name,
             "initial_collection": initial_collection,
@@ -101,10 +172,11 @@ def create_database(
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to create database '{database_name}': {e}")
+        logger.error("Failed to create database '%s': %s", database_name, e)
         raise
 
 
+@require_args("database_name")
 def drop_database(database_name: str) -> Dict[str, Any]:
     """Delete an entire database and all its collections.
     
@@ -118,26 +190,27 @@ def drop_database(database_name: str) -> Dict[str, Any]:
         PyMongoError: If the operation fails
         ValueError: If database name is not provided
     """
-    if not database_name:
-        msg = "Database name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         client = get_client()
         client.drop_database(database_name)
-        
-        logger.info(f"Dropped database '{database_name}'")
+        get_collection.cache_clear()
+        get_json_safe_collection.cache_clear()
+        _invalidate_metadata_caches()
+        _invalidate_index_cache(database_name)
+
+        logger.info("Dropped database '%s'", database_name)
         return {
             "database_name": database_name,
             "success": True,
             "message": f"Database '{database_name}' has been deleted"
         }
     except PyMongoError as e:
-        logger.error(f"Failed to drop database '{database_name}': {e}")
+        logger.error("Failed to drop database '%s': %s", database_name, e)
         raise
 
 
+@require_args("database_name")
+@ttl_cache(ttl=METADATA_CACHE_TTL)
 def get_database_stats(database_name: str) -> Dict[str, Any]:
     """Get statistics information for a database.
     
@@ -151,11 +224,6 @@ def get_database_stats(database_name: str) -> Dict[str, Any]:
         PyMongoError: If the operation fails
         ValueError: If database name is not provided
     """
-    if not database_name:
-        msg = "Database name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         db = get_database(database_name)
         stats = db.command("dbStats")
@@ -174,13 +242,14 @@ def get_database_stats(database_name: str) -> Dict[str, Any]:
             "file_size": stats.get("fileSize", 0),
         }
         
-        logger.info(f"Retrieved stats for database '{database_name}'")
+        logger.info("Retrieved stats for database '%s'", database_name)
         return clean_stats
     except PyMongoError as e:
-        logger.error(f"Failed to get stats for database '{database_name}': {e}")
+        logger.error("Failed to get stats for database '%s': %s", database_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def create_collection(
     database_name: str, 
     collection_name: str, 
@@ -200,11 +269,6 @@ def create_collection(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         db = get_database(database_name)
         
@@ -212,8 +276,9 @@ def create_collection(
             collection = db.create_collection(collection_name, **options)
         else:
             collection = db.create_collection(collection_name)
-        
-        logger.info(f"Created collection '{collection_name}' in database '{database_name}'")
+        _invalidate_metadata_caches()
+
+        logger.info("Created collection '%s' in database '%s'", collection_name, database_name)
         return {
             "database_name": database_name,
             "collection_name": collection_name,
@@ -221,10 +286,11 @@ def create_collection(
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to create collection '{collection_name}' in database '{database_name}': {e}")
+        logger.error("Failed to create collection '%s' in database '%s': %s", collection_name, database_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def drop_collection(database_name: str, collection_name: str) -> Dict[str, Any]:
     """Delete a collection from the database.
     
@@ -239,16 +305,15 @@ def drop_collection(database_name: str, collection_name: str) -> Dict[str, Any]:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         db = get_database(database_name)
         db.drop_collection(collection_name)
-        
-        logger.info(f"Dropped collection '{collection_name}' from database '{database_name}'")
+        get_collection.cache_clear()
+        get_json_safe_collection.cache_clear()
+        _invalidate_metadata_caches()
+        _invalidate_index_cache(database_name, collection_name)
+
+        logger.info("Dropped collection '%s' from database '%s'", collection_name, database_name)
         return {
             "database_name": database_name,
             "collection_name": collection_name,
@@ -256,10 +321,11 @@ def drop_collection(database_name: str, collection_name: str) -> Dict[str, Any]:
             "message": f"Collection '{collection_name}' has been deleted"
         }
     except PyMongoError as e:
-        logger.error(f"Failed to drop collection '{collection_name}' from database '{database_name}': {e}")
+        logger.error("Failed to drop collection '%s' from database '%s': %s", collection_name, database_name, e)
         raise
 
 
+@require_args("database_name", "old_name", "new_name")
 def rename_collection(database_name: str, old_name: str, new_name: str) -> Dict[str, Any]:
     """Rename a collection.
     
@@ -275,17 +341,17 @@ def rename_collection(database_name: str, old_name: str, new_name: str) -> Dict[
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not old_name or not new_name:
-        msg = "Database name, old name, and new name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         db = get_database(database_name)
         collection = db[old_name]
         collection.rename(new_name)
-        
-        logger.info(f"Renamed collection '{old_name}' to '{new_name}' in database '{database_name}'")
+        get_collection.cache_clear()
+        get_json_safe_collection.cache_clear()
+        _invalidate_metadata_caches()
+        _invalidate_index_cache(database_name, old_name)
+        _invalidate_index_cache(database_name, new_name)
+
+        logger.info("Renamed collection '%s' to '%s' in database '%s'", old_name, new_name, database_name)
         return {
             "database_name": database_name,
             "old_name": old_name,
@@ -293,10 +359,12 @@ def rename_collection(database_name: str, old_name: str, new_name: str) -> Dict[
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to rename collection '{old_name}' to '{new_name}' in database '{database_name}': {e}")
+        logger.error("Failed to rename collection '%s' to '%s' in database '%s': %s", old_name, new_name, database_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
+@ttl_cache(ttl=METADATA_CACHE_TTL)
 def get_collection_stats(database_name: str, collection_name: str) -> Dict[str, Any]:
     """Get statistics information for a collection.
     
@@ -311,11 +379,6 @@ def get_collection_stats(database_name: str, collection_name: str) -> Dict[str,
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     try:
         db = get_database(database_name)
         stats = db.command("collStats", collection_name)
@@ -333,8 +396,62 @@ def get_collection_stats(database_name: str, collection_name: str) -> Dict[str,
             "index_sizes": stats.get("indexSizes", {}),
         }
         
-        logger.info(f"Retrieved stats for collection '{collection_name}' in database '{database_name}'")
+        logger.info("Retrieved stats for collection '%s' in database '%s'", collection_name, database_name)
         return clean_stats
     except PyMongoError as e:
-        logger.error(f"Failed to get stats for collection '{collection_name}' in database '{database_name}': {e}")
-        raise 
\ No newline at end of file
+        logger.error("Failed to get stats for collection '%s' in database '%s': %s", collection_name, database_name, e)
+        raise
+
+
+@require_args("database_name")
+def get_all_collection_stats(database_name: str) -> List[Dict[str, Any]]:
+    """Get statistics for every collection in a database in one call.
+
+    Uses the $collStats aggregation stage instead of one collStats admin
+    command per collection, and gathers the per-collection pipelines
+    concurrently so the total latency is one round-trip rather than N.
+
+    Args:
+        database_name: Name of the database
+
+    Returns:
+        List[Dict[str, Any]]: Statistics for each collection
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If database name is not provided
+    """
+    try:
+        db = get_database(database_name)
+        collection_names = db.list_collection_names()
+
+        def fetch(name: str) -> Dict[str, Any]:
+            stats = next(
+                db[name].aggregate([{"$collStats": {"storageStats": {}}}]), {}
+            )
+            storage = stats.get("storageStats", {})
+            return {
+                "ns": stats.get("ns", f"{database_name}.{name}"),
+                "count": storage.get("count", 0),
+                "size": storage.get("size", 0),
+                "avg_obj_size": storage.get("avgObjSize", 0),
+                "storage_size": storage.get("storageSize", 0),
+                "capped": storage.get("capped", False),
+                "nindexes": storage.get("nindexes", 0),
+                "total_index_size": storage.get("totalIndexSize", 0),
+                "index_sizes": storage.get("indexSizes", {}),
+            }
+
+        if not collection_names:
+            all_stats = []
+        elif len(collection_names) == 1:
+            all_stats = [fetch(collection_names[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(collection_names))) as pool:
+                all_stats = list(pool.map(fetch, collection_names))
+
+        logger.info("Retrieved stats for %s collections in database '%s'", len(all_stats), database_name)
+        return all_stats
+    except PyMongoError as e:
+        logger.error("Failed to get collection stats for database '%s': %s", database_name, e)
+        raise
\ No newline at end of file
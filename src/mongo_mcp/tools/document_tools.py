@@ -1,14 +1,30 @@
 """Document-level operation tools for MongoDB."""
 
+import asyncio
+import re
 from typing import List, Dict, Any, Optional, Union
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
 from pymongo.errors import PyMongoError
+from bson.json_util import RELAXED_JSON_OPTIONS, dumps as bson_dumps
 from bson.objectid import ObjectId
 
-from mongo_mcp.db import get_collection
-from mongo_mcp.config import logger
+from mongo_mcp.db import get_collection, get_async_collection, get_json_safe_collection
+from mongo_mcp.config import logger, MONGODB_MAX_TIME_MS
 from mongo_mcp.utils.json_encoder import clean_document_for_json
+from mongo_mcp.utils.validation import require_args
 
+# Compiled once — C-speed check for a 24-char ObjectId hex string
+_OID_MATCH = re.compile(r"[0-9a-fA-F]{24}\Z").match
 
+
+@require_args("database_name", "collection_name")
 def insert_document(
     database_name: str, 
     collection_name: str, 
@@ -28,11 +44,6 @@ def insert_document(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not document or not isinstance(document, dict):
         msg = "Document must be a non-empty dictionary"
         logger.error(msg)
@@ -43,27 +54,29 @@ def insert_document(
         result = collection.insert_one(document)
         
         inserted_id = str(result.inserted_id)
-        logger.info(f"Inserted document with ID '{inserted_id}' into {database_name}.{collection_name}")
+        logger.info("Inserted document with ID '%s' into %s.%s", inserted_id, database_name, collection_name)
         
-        return {"inserted_id": inserted_id, "success": True}
+        return {"inserted_id": inserted_id}
     except PyMongoError as e:
-        logger.error(f"Failed to insert document into {database_name}.{collection_name}: {e}")
+        logger.error("Failed to insert document into %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def insert_many_documents(
     database_name: str,
     collection_name: str,
     documents: List[Dict[str, Any]],
-    ordered: bool = True
+    ordered: bool = False
 ) -> Dict[str, Any]:
     """Insert multiple documents into the specified collection.
-    
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
         documents: List of documents to insert
-        ordered: Whether to perform ordered or unordered inserts
+        ordered: Whether to perform ordered inserts; unordered (the default)
+            lets the server parallelize and continue past individual failures
     
     Returns:
         Dict[str, Any]: Result containing the inserted document IDs
@@ -72,11 +85,6 @@ def insert_many_documents(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not documents or not isinstance(documents, list):
         msg = "Documents must be a non-empty list"
         logger.error(msg)
@@ -86,19 +94,114 @@ def insert_many_documents(
         collection = get_collection(database_name, collection_name)
         result = collection.insert_many(documents, ordered=ordered)
         
-        inserted_ids = [str(oid) for oid in result.inserted_ids]
-        logger.info(f"Inserted {len(inserted_ids)} documents into {database_name}.{collection_name}")
+        # map(str, ...) runs the conversion loop at C level, which matters
+        # when a single call inserts thousands of documents
+        inserted_ids = list(map(str, result.inserted_ids))
+        logger.info("Inserted %s documents into %s.%s", len(inserted_ids), database_name, collection_name)
         
         return {
             "inserted_ids": inserted_ids,
-            "inserted_count": len(inserted_ids),
-            "success": True
+            "inserted_count": len(inserted_ids)
         }
     except PyMongoError as e:
-        logger.error(f"Failed to insert documents into {database_name}.{collection_name}: {e}")
+        logger.error("Failed to insert documents into %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+# Map from operation type name to the PyMongo request class and the argument
+# keys pulled from each operation dict, in constructor order
+_BULK_OP_BUILDERS = {
+    "insert_one": (InsertOne, ("document",)),
+    "update_one": (UpdateOne, ("filter", "update")),
+    "update_many": (UpdateMany, ("filter", "update")),
+    "replace_one": (ReplaceOne, ("filter", "replacement")),
+    "delete_one": (DeleteOne, ("filter",)),
+    "delete_many": (DeleteMany, ("filter",)),
+}
+
+
+@require_args("database_name", "collection_name")
+def bulk_write_documents(
+    database_name: str,
+    collection_name: str,
+    operations: List[Dict[str, Any]],
+    ordered: bool = False
+) -> Dict[str, Any]:
+    """Execute a mixed batch of write operations in a single round-trip.
+
+    Each operation is a dictionary with a "type" key naming the operation
+    (insert_one, update_one, update_many, replace_one, delete_one,
+    delete_many) plus the arguments that operation needs: "document" for
+    inserts, "filter" and "update" for updates, "filter" and "replacement"
+    for replaces, and "filter" for deletes. Updates and replaces also accept
+    an optional "upsert" flag.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        operations: List of operation dictionaries as described above
+        ordered: Whether to stop at the first failure; unordered (the
+            default) lets the server parallelize the batch
+
+    Returns:
+        Dict[str, Any]: Counts from the bulk write result
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing or an operation is malformed
+    """
+    if not operations or not isinstance(operations, list):
+        msg = "Operations must be a non-empty list"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    requests = []
+    for op in operations:
+        if not isinstance(op, dict) or "type" not in op:
+            msg = "Each operation must be a dictionary with a 'type' key"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        builder = _BULK_OP_BUILDERS.get(op["type"])
+        if builder is None:
+            msg = f"Unknown bulk operation type: {op['type']}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        op_class, arg_keys = builder
+        try:
+            args = [
+                _convert_id_strings(op[key]) if key == "filter" else op[key]
+                for key in arg_keys
+            ]
+        except KeyError as e:
+            msg = f"Operation '{op['type']}' is missing required key {e}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if op_class in (UpdateOne, UpdateMany, ReplaceOne):
+            requests.append(op_class(*args, upsert=op.get("upsert", False)))
+        else:
+            requests.append(op_class(*args))
+
+    try:
+        collection = get_collection(database_name, collection_name)
+        result = collection.bulk_write(requests, ordered=ordered)
+
+        logger.info("Executed %s bulk operations on %s.%s", len(requests), database_name, collection_name)
+        return {
+            "inserted_count": result.inserted_count,
+            "matched_count": result.matched_count,
+            "modified_count": result.modified_count,
+            "deleted_count": result.deleted_count,
+            "upserted_count": result.upserted_count
+        }
+    except PyMongoError as e:
+        logger.error("Failed to execute bulk write on %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
 def find_documents(
     database_name: str,
     collection_name: str,
@@ -124,24 +227,28 @@ def find_documents(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict):
         msg = "Query must be a dictionary"
         logger.error(msg)
         raise ValueError(msg)
     
     try:
-        collection = get_collection(database_name, collection_name)
-        
+        # The JSON-safe codec decodes ObjectIds to strings in C during BSON
+        # decoding, sparing the per-document Python walk that step
+        collection = get_json_safe_collection(database_name, collection_name)
+
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
-        
-        # Execute query
-        cursor = collection.find(query, projection=projection)
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        # Execute query; the comment tags the op for db.currentOp/killOp
+        # and maxTimeMS lets the server abort runaway scans
+        cursor = collection.find(
+            query,
+            projection=projection,
+            comment="mcp:find_documents",
+            max_time_ms=MONGODB_MAX_TIME_MS,
+        )
         
         # Apply sort if provided
         if sort:
@@ -152,17 +259,83 @@ def find_documents(
             cursor = cursor.limit(limit)
         
         # Convert to list and ensure ObjectId is converted to string
-        documents = _process_query_results(cursor)
-        
+        documents = list(_iter_query_results(cursor))
+
         result_count = len(documents)
-        logger.info(f"Found {result_count} documents in {database_name}.{collection_name}")
+        logger.info("Found %s documents in %s.%s", result_count, database_name, collection_name)
         
         return documents
     except PyMongoError as e:
-        logger.error(f"Failed to find documents in {database_name}.{collection_name}: {e}")
+        logger.error("Failed to find documents in %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+def find_documents_json(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    limit: int = 0,
+    sort: Optional[Dict[str, Any]] = None
+) -> str:
+    """Find documents and return them as an Extended JSON string.
+
+    Serializes the whole batch with bson.json_util.dumps, which runs in the
+    C BSON extension, instead of walking each document in Python. BSON types
+    are rendered in relaxed Extended JSON (e.g. _id becomes
+    {"$oid": "..."}), which is why this is a separate entry point rather
+    than a change to find_documents' output shape.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        projection: MongoDB projection (fields to include/exclude)
+        limit: Maximum number of documents to return (0 for no limit)
+        sort: MongoDB sort specification
+
+    Returns:
+        str: JSON array of matching documents in relaxed Extended JSON
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(query, dict):
+        msg = "Query must be a dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_collection(database_name, collection_name)
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        cursor = collection.find(
+            query,
+            projection=projection,
+            comment="mcp:find_documents_json",
+            max_time_ms=MONGODB_MAX_TIME_MS,
+        )
+        if sort:
+            cursor = cursor.sort(list(sort.items()))
+        if limit > 0:
+            cursor = cursor.limit(limit)
+
+        result = bson_dumps(
+            list(cursor.batch_size(1000)), json_options=RELAXED_JSON_OPTIONS
+        )
+
+        logger.info("Serialized documents from %s.%s as Extended JSON", database_name, collection_name)
+        return result
+    except PyMongoError as e:
+        logger.error("Failed to find documents in %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def find_one_document(
     database_name: str,
     collection_name: str,
@@ -184,37 +357,39 @@ def find_one_document(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict):
         msg = "Query must be a dictionary"
         logger.error(msg)
         raise ValueError(msg)
     
     try:
-        collection = get_collection(database_name, collection_name)
-        
+        collection = get_json_safe_collection(database_name, collection_name)
+
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
-        
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
         # Execute query
-        document = collection.find_one(query, projection=projection)
+        document = collection.find_one(
+            query,
+            projection=projection,
+            comment="mcp:find_one_document",
+            max_time_ms=MONGODB_MAX_TIME_MS,
+        )
         
         if document:
             document = clean_document_for_json(document)
-            logger.info(f"Found document in {database_name}.{collection_name}")
+            logger.info("Found document in %s.%s", database_name, collection_name)
         else:
-            logger.info(f"No document found in {database_name}.{collection_name}")
+            logger.info("No document found in %s.%s", database_name, collection_name)
         
         return document
     except PyMongoError as e:
-        logger.error(f"Failed to find document in {database_name}.{collection_name}: {e}")
+        logger.error("Failed to find document in %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def count_documents(
     database_name: str,
     collection_name: str,
@@ -234,11 +409,6 @@ def count_documents(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict):
         msg = "Query must be a dictionary"
         logger.error(msg)
@@ -246,19 +416,32 @@ def count_documents(
     
     try:
         collection = get_collection(database_name, collection_name)
-        
+
+        # An empty query can use the O(1) metadata-based estimate instead of
+        # the countDocuments aggregation, which scans the whole collection
+        if not query:
+            count = collection.estimated_document_count(
+                comment="mcp:count_documents"
+            )
+            logger.info("Estimated %s documents in %s.%s", count, database_name, collection_name)
+            return count
+
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
-        
-        count = collection.count_documents(query)
-        logger.info(f"Counted {count} documents in {database_name}.{collection_name}")
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        count = collection.count_documents(
+            query, maxTimeMS=MONGODB_MAX_TIME_MS, comment="mcp:count_documents"
+        )
+        logger.info("Counted %s documents in %s.%s", count, database_name, collection_name)
         
         return count
     except PyMongoError as e:
-        logger.error(f"Failed to count documents in {database_name}.{collection_name}: {e}")
+        logger.error("Failed to count documents in %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def update_document(
     database_name: str,
     collection_name: str,
@@ -284,18 +467,16 @@ def update_document(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing or invalid
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict) or not isinstance(update_data, dict):
         msg = "Query and update_data must be dictionaries"
         logger.error(msg)
         raise ValueError(msg)
     
-    # Check if update_data contains MongoDB operators
-    if not any(key.startswith("$") for key in update_data):
+    # Check if update_data contains MongoDB operators. Operator documents
+    # are almost always single-operator ({"$set": ...}), so peek at the first
+    # key before paying for the full generator scan
+    first_key = next(iter(update_data), "")
+    if not first_key.startswith("$") and not any(key.startswith("$") for key in update_data):
         # If not, wrap it in $set
         update_data = {"$set": update_data}
     
@@ -303,14 +484,17 @@ def update_document(
         collection = get_collection(database_name, collection_name)
         
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
         
         # Execute update
         if update_many:
-            result = collection.update_many(query, update_data, upsert=upsert)
+            result = collection.update_many(
+                query, update_data, upsert=upsert, comment="mcp:update_document"
+            )
             matched = result.matched_count
             modified = result.modified_count
-            logger.info(f"Updated {modified} of {matched} documents in {database_name}.{collection_name}")
+            logger.info("Updated %s of %s documents in %s.%s", modified, matched, database_name, collection_name)
             
             return {
                 "matched_count": matched,
@@ -318,8 +502,10 @@ def update_document(
                 "upserted_id": str(result.upserted_id) if result.upserted_id else None
             }
         else:
-            result = collection.update_one(query, update_data, upsert=upsert)
-            logger.info(f"Updated document in {database_name}.{collection_name}")
+            result = collection.update_one(
+                query, update_data, upsert=upsert, comment="mcp:update_document"
+            )
+            logger.info("Updated document in %s.%s", database_name, collection_name)
             
             return {
                 "matched_count": result.matched_count,
@@ -327,10 +513,11 @@ def update_document(
                 "upserted_id": str(result.upserted_id) if result.upserted_id else None
             }
     except PyMongoError as e:
-        logger.error(f"Failed to update document(s) in {database_name}.{collection_name}: {e}")
+        logger.error("Failed to update document(s) in %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def replace_document(
     database_name: str,
     collection_name: str,
@@ -354,11 +541,6 @@ def replace_document(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing or invalid
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict) or not isinstance(replacement, dict):
         msg = "Query and replacement must be dictionaries"
         logger.error(msg)
@@ -374,22 +556,26 @@ def replace_document(
         collection = get_collection(database_name, collection_name)
         
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
         
         # Execute replace
-        result = collection.replace_one(query, replacement, upsert=upsert)
+        result = collection.replace_one(
+            query, replacement, upsert=upsert, comment="mcp:replace_document"
+        )
         
-        logger.info(f"Replaced document in {database_name}.{collection_name}")
+        logger.info("Replaced document in %s.%s", database_name, collection_name)
         return {
             "matched_count": result.matched_count,
             "modified_count": result.modified_count,
             "upserted_id": str(result.upserted_id) if result.upserted_id else None
         }
     except PyMongoError as e:
-        logger.error(f"Failed to replace document in {database_name}.{collection_name}: {e}")
+        logger.error("Failed to replace document in %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def delete_document(
     database_name: str,
     collection_name: str,
@@ -411,11 +597,6 @@ def delete_document(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not isinstance(query, dict):
         msg = "Query must be a dictionary"
         logger.error(msg)
@@ -425,70 +606,434 @@ def delete_document(
         collection = get_collection(database_name, collection_name)
         
         # Convert ObjectId strings in the query if present
-        query = _convert_id_strings(query)
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
         
         # Execute delete
         if delete_many:
-            result = collection.delete_many(query)
-            logger.info(f"Deleted {result.deleted_count} documents from {database_name}.{collection_name}")
+            result = collection.delete_many(query, comment="mcp:delete_document")
+            logger.info("Deleted %s documents from %s.%s", result.deleted_count, database_name, collection_name)
         else:
-            result = collection.delete_one(query)
-            logger.info(f"Deleted {result.deleted_count} document from {database_name}.{collection_name}")
+            result = collection.delete_one(query, comment="mcp:delete_document")
+            logger.info("Deleted %s document from %s.%s", result.deleted_count, database_name, collection_name)
         
         return {"deleted_count": result.deleted_count}
     except PyMongoError as e:
-        logger.error(f"Failed to delete document(s) from {database_name}.{collection_name}: {e}")
+        logger.error("Failed to delete document(s) from %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
+async def insert_document_async(
+    database_name: str,
+    collection_name: str,
+    document: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Async variant of insert_document.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        document: Document to insert (JSON-compatible dictionary)
+
+    Returns:
+        Dict[str, Any]: Result containing the inserted document's ID
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not document or not isinstance(document, dict):
+        msg = "Document must be a non-empty dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+        result = await collection.insert_one(document)
+
+        inserted_id = str(result.inserted_id)
+        logger.info("Inserted document with ID '%s' into %s.%s", inserted_id, database_name, collection_name)
+
+        return {"inserted_id": inserted_id}
+    except PyMongoError as e:
+        logger.error("Failed to insert document into %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def find_documents_async(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    limit: int = 0,
+    sort: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Async variant of find_documents.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        projection: MongoDB projection (fields to include/exclude)
+        limit: Maximum number of documents to return (0 for no limit)
+        sort: MongoDB sort specification
+
+    Returns:
+        List[Dict[str, Any]]: List of matching documents
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(query, dict):
+        msg = "Query must be a dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        cursor = collection.find(query, projection=projection)
+        if sort:
+            cursor = cursor.sort(list(sort.items()))
+        if limit > 0:
+            cursor = cursor.limit(limit)
+
+        documents = [clean_document_for_json(doc) async for doc in cursor]
+
+        logger.info("Found %s documents in %s.%s", len(documents), database_name, collection_name)
+        return documents
+    except PyMongoError as e:
+        logger.error("Failed to find documents in %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def find_one_document_async(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Async variant of find_one_document.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        projection: MongoDB projection (fields to include/exclude)
+
+    Returns:
+        Optional[Dict[str, Any]]: The found document or None
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(query, dict):
+        msg = "Query must be a dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+        document = await collection.find_one(query, projection=projection)
+
+        if document:
+            document = clean_document_for_json(document)
+            logger.info("Found document in %s.%s", database_name, collection_name)
+        else:
+            logger.info("No document found in %s.%s", database_name, collection_name)
+
+        return document
+    except PyMongoError as e:
+        logger.error("Failed to find document in %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def count_documents_async(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any]
+) -> int:
+    """Async variant of count_documents.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+
+    Returns:
+        int: Number of matching documents
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(query, dict):
+        msg = "Query must be a dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if not query:
+            count = await collection.estimated_document_count()
+            logger.info("Estimated %s documents in %s.%s", count, database_name, collection_name)
+            return count
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+        count = await collection.count_documents(query)
+        logger.info("Counted %s documents in %s.%s", count, database_name, collection_name)
+
+        return count
+    except PyMongoError as e:
+        logger.error("Failed to count documents in %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def update_document_async(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    update_data: Dict[str, Any],
+    upsert: bool = False,
+    update_many: bool = False
+) -> Dict[str, Any]:
+    """Async variant of update_document.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        update_data: MongoDB update document (must include operators like $set)
+        upsert: Whether to insert if no document matches the query
+        update_many: Whether to update all matching documents or just the first one
+
+    Returns:
+        Dict[str, Any]: Result of the update operation
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing or invalid
+    """
+    if not isinstance(query, dict) or not isinstance(update_data, dict):
+        msg = "Query and update_data must be dictionaries"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    first_key = next(iter(update_data), "")
+    if not first_key.startswith("$") and not any(key.startswith("$") for key in update_data):
+        update_data = {"$set": update_data}
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        if update_many:
+            result = await collection.update_many(query, update_data, upsert=upsert)
+            logger.info("Updated %s of %s documents in %s.%s", result.modified_count, result.matched_count, database_name, collection_name)
+        else:
+            result = await collection.update_one(query, update_data, upsert=upsert)
+            logger.info("Updated document in %s.%s", database_name, collection_name)
+
+        return {
+            "matched_count": result.matched_count,
+            "modified_count": result.modified_count,
+            "upserted_id": str(result.upserted_id) if result.upserted_id else None
+        }
+    except PyMongoError as e:
+        logger.error("Failed to update document(s) in %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
+async def delete_document_async(
+    database_name: str,
+    collection_name: str,
+    query: Dict[str, Any],
+    delete_many: bool = False
+) -> Dict[str, Any]:
+    """Async variant of delete_document.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        query: MongoDB query filter
+        delete_many: Whether to delete all matching documents or just the first one
+
+    Returns:
+        Dict[str, Any]: Result of the delete operation
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not isinstance(query, dict):
+        msg = "Query must be a dictionary"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_async_collection(database_name, collection_name)
+
+        if query and _maybe_has_oid(query):
+            query = _convert_id_strings(query)
+
+        if delete_many:
+            result = await collection.delete_many(query)
+        else:
+            result = await collection.delete_one(query)
+
+        logger.info("Deleted %s document(s) from %s.%s", result.deleted_count, database_name, collection_name)
+        return {"deleted_count": result.deleted_count}
+    except PyMongoError as e:
+        logger.error("Failed to delete document(s) from %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+# Operation names accepted by execute_many, mapped to their async variants
+_EXECUTE_MANY_DISPATCH = {
+    "insert_document": insert_document_async,
+    "find_documents": find_documents_async,
+    "find_one_document": find_one_document_async,
+    "count_documents": count_documents_async,
+    "update_document": update_document_async,
+    "delete_document": delete_document_async,
+}
+
+
+async def execute_many(operations: List[Dict[str, Any]]) -> List[Any]:
+    """Run several document operations concurrently.
+
+    Each operation is a dictionary with a "type" key naming one of the
+    async document tools (insert_document, find_documents,
+    find_one_document, count_documents, update_document, delete_document)
+    plus that tool's keyword arguments. All operations are dispatched with
+    asyncio.gather, so total latency is the slowest round-trip rather than
+    the sum of them.
+
+    Args:
+        operations: List of operation dictionaries as described above
+
+    Returns:
+        List[Any]: Per-operation results, in submission order
+
+    Raises:
+        PyMongoError: If any operation fails
+        ValueError: If an operation is malformed
+    """
+    if not operations or not isinstance(operations, list):
+        msg = "Operations must be a non-empty list"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    # Validate the whole list before creating any coroutine, so a malformed
+    # operation mid-list can't leave earlier coroutines abandoned un-awaited
+    dispatched = []
+    for op in operations:
+        if not isinstance(op, dict) or "type" not in op:
+            msg = "Each operation must be a dictionary with a 'type' key"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        func = _EXECUTE_MANY_DISPATCH.get(op["type"])
+        if func is None:
+            msg = f"Unknown operation type: {op['type']}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        dispatched.append((func, {key: value for key, value in op.items() if key != "type"}))
+
+    tasks = [func(**kwargs) for func, kwargs in dispatched]
+    results = await asyncio.gather(*tasks)
+    logger.info("Executed %s concurrent operations", len(results))
+    return list(results)
+
+
+def _maybe_has_oid(query: Dict[str, Any]) -> bool:
+    """Cheaply decide whether a query could contain ObjectId strings.
+
+    Only a 24-character top-level string value or a nested container can
+    yield a conversion, so plain scalar filters skip the full walk.
+
+    Args:
+        query: The query dictionary to inspect
+
+    Returns:
+        bool: True when _convert_id_strings might find something to convert
+    """
+    return any(
+        isinstance(v, (dict, list)) or (type(v) is str and len(v) == 24)
+        for v in query.values()
+    )
+
+
 def _convert_id_strings(query: Dict[str, Any]) -> Dict[str, Any]:
     """Convert string representations of ObjectId to actual ObjectId objects.
-    
-    This function recursively processes a query dictionary and converts
-    any string values that look like MongoDB ObjectIds into actual ObjectId objects.
-    
+
+    The query is walked iteratively with an explicit stack and mutated in
+    place — queries arrive freshly deserialized from MCP requests, so this
+    module owns them and doesn't need to rebuild nested containers. Candidate
+    strings are validated with a precompiled hex regex, which is cheaper than
+    ObjectId.is_valid's exception-driven constructor probe.
+
     Args:
-        query: The query dictionary to process
-        
+        query: The query dictionary to process (mutated in place)
+
     Returns:
         Dict[str, Any]: The processed query with ObjectIds converted
     """
     if not isinstance(query, dict):
         return query
-        
-    converted = {}
-    for key, value in query.items():
-        if isinstance(value, str) and ObjectId.is_valid(value):
-            # Convert string ObjectId to ObjectId object
-            converted[key] = ObjectId(value)
-        elif isinstance(value, dict):
-            # Recursively process nested dictionaries
-            converted[key] = _convert_id_strings(value)
-        elif isinstance(value, list):
-            # Process lists that might contain ObjectId strings
-            converted[key] = [
-                ObjectId(item) if isinstance(item, str) and ObjectId.is_valid(item) else item
-                for item in value
-            ]
+
+    stack = [query]
+    while stack:
+        container = stack.pop()
+        if type(container) is dict:
+            for key, value in container.items():
+                if type(value) is str:
+                    if len(value) == 24 and _OID_MATCH(value):
+                        container[key] = ObjectId(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
         else:
-            converted[key] = value
-    
-    return converted
+            for i, value in enumerate(container):
+                if type(value) is str:
+                    if len(value) == 24 and _OID_MATCH(value):
+                        container[i] = ObjectId(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
 
+    return query
+
+
+def _iter_query_results(cursor):
+    """Stream query results with ObjectIds converted for JSON serialization.
+
+    Documents are cleaned one at a time as the cursor is consumed, so large
+    result sets never hold both raw and cleaned copies in memory at once. The
+    batch size is raised from the server default to cut getMore round-trips.
 
-def _process_query_results(cursor) -> List[Dict[str, Any]]:
-    """Process query results and convert ObjectIds to strings for JSON serialization.
-    
     Args:
         cursor: MongoDB cursor object
-        
-    Returns:
-        List[Dict[str, Any]]: List of processed documents
+
+    Yields:
+        Dict[str, Any]: Processed documents
     """
-    documents = []
-    for doc in cursor:
-        # Use the clean_document_for_json utility
-        cleaned_doc = clean_document_for_json(doc)
-        documents.append(cleaned_doc)
-    
-    return documents 
\ No newline at end of file
+    for doc in cursor.batch_size(1000):
+        yield clean_document_for_json(doc) 
\ No newline at end of file
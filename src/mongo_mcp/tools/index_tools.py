@@ -1,63 +1,371 @@
 """Index management tools for MongoDB."""
 
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
-from pymongo.errors import PyMongoError
-from pymongo import TEXT, ASCENDING, DESCENDING
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure, PyMongoError
 
+# get_collection is memoized per (database, collection) in mongo_mcp.db, so
+# repeated tool calls reuse the same handle without re-resolving names
 from mongo_mcp.db import get_collection
-from mongo_mcp.config import logger
+from mongo_mcp.config import logger, INDEX_CACHE_TTL
+from mongo_mcp.utils.validation import require_args
 
+# Cached cleaned index listings keyed by (database, collection). Index
+# definitions change rarely, so entries are served fresh within
+# INDEX_CACHE_TTL and stale entries are still returned immediately while a
+# single background worker refreshes them (stale-while-revalidate).
+_INDEX_CACHE: Dict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+_INDEX_REFRESHER = ThreadPoolExecutor(max_workers=1)
+_REFRESHING: set = set()
 
-def list_indexes(database_name: str, collection_name: str) -> List[Dict[str, Any]]:
+# Accepted direction aliases mapped to pymongo's sort values (the literals
+# 1, -1 and "text" are what pymongo's ASCENDING/DESCENDING/TEXT constants
+# resolve to). Unlisted values (e.g. "2dsphere", "hashed") pass through
+# unchanged.
+_DIRECTION_MAP = {
+    1: 1,
+    "asc": 1,
+    "ascending": 1,
+    -1: -1,
+    "desc": -1,
+    "descending": -1,
+    "text": "text",
+}
+
+# Validation error messages, interned once instead of rebuilt per failure
+_ERR_KEYS = "Keys must be a non-empty dictionary"
+_ERR_FIELDS = "Fields must be a non-empty list"
+_ERR_FIELD_SPECS = "Field specifications must be a non-empty list"
+_ERR_INDEX_SPECS = "Index specifications must be a non-empty list"
+_ERR_FIELD_SPEC_SHAPE = "Each field specification must be a (field_name, direction) tuple"
+_ERR_INDEX_SPEC_SHAPE = "Each index specification must be a dictionary with a 'keys' mapping"
+_ERR_PROTECTED_INDEX = "Cannot drop the default _id index"
+
+# Indexes that must never be dropped; O(1) membership check in drop_index
+_PROTECTED_INDEXES = frozenset({"_id_"})
+
+# Index options accepted by createIndex; unknown keys are rejected client
+# side instead of wasting a round trip on a server error
+_KNOWN_INDEX_OPTS = frozenset({
+    "unique", "sparse", "background", "name", "expireAfterSeconds",
+    "partialFilterExpression", "collation", "wildcardProjection", "hidden",
+    "storageEngine", "weights", "default_language", "language_override",
+    "textIndexVersion", "2dsphereIndexVersion", "bits", "min", "max",
+    "bucketSize",
+})
+
+
+def _check_index_options(options: Optional[Dict[str, Any]]) -> None:
+    """Fail fast on option names createIndex would reject server-side."""
+    if not options:
+        return
+    unknown = options.keys() - _KNOWN_INDEX_OPTS
+    if unknown:
+        msg = f"Unknown index options: {sorted(unknown)}"
+        logger.error(msg)
+        raise ValueError(msg)
+
+# Optional index attributes copied to the cleaned listing only when present,
+# as (server field name, cleaned key name) pairs. This covers every index
+# option the server records, so a cached entry reflects the full option set —
+# _find_cached_index relies on that to rule out false matches.
+_OPTIONAL_INDEX_KEYS = (
+    ("textIndexVersion", "text_index_version"),
+    ("2dsphereIndexVersion", "2dsphere_index_version"),
+    ("expireAfterSeconds", "expire_after_seconds"),
+    ("weights", "weights"),
+    ("default_language", "default_language"),
+    ("language_override", "language_override"),
+    ("partialFilterExpression", "partial_filter_expression"),
+    ("collation", "collation"),
+    ("wildcardProjection", "wildcard_projection"),
+    ("hidden", "hidden"),
+    ("storageEngine", "storage_engine"),
+    ("bits", "bits"),
+    ("min", "min"),
+    ("max", "max"),
+    ("bucketSize", "bucket_size"),
+)
+
+
+# Cleaned-listing keys translated back to createIndex option names, used
+# when matching a requested index against the cached snapshot
+_CLEAN_TO_OPTION_KEY = {
+    "unique": "unique",
+    "sparse": "sparse",
+    "background": "background",
+}
+_CLEAN_TO_OPTION_KEY.update({clean: source for source, clean in _OPTIONAL_INDEX_KEYS})
+
+# Options that default to False on the server, where an explicit False in a
+# request means the same as omitting the option entirely
+_BOOLEAN_DEFAULT_OPTS = frozenset({"unique", "sparse", "background", "hidden"})
+
+
+def _find_cached_index(
+    database_name: str,
+    collection_name: str,
+    index_keys: List[Tuple[str, Any]],
+    options: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """Return the name of a cached index identical to the requested spec.
+
+    The server no-ops createIndex when an identical index exists but still
+    charges a round trip; a hit against the cached listing avoids it. Only
+    exact matches count — same key pattern and same non-default options.
+    """
+    with _INDEX_CACHE_LOCK:
+        entry = _INDEX_CACHE.get((database_name, collection_name))
+    if entry is None:
+        return None
+
+    # Compare on "is not None" rather than truthiness: falsy values like
+    # expireAfterSeconds=0 are meaningful. Only an explicit False on a
+    # boolean-default option equals the default.
+    wanted_keys = tuple(index_keys)
+    wanted_opts = {
+        k: v
+        for k, v in (options or {}).items()
+        if k != "name" and v is not None and not (v is False and k in _BOOLEAN_DEFAULT_OPTS)
+    }
+    wanted_name = (options or {}).get("name")
+
+    for clean_index in entry[1]:
+        if tuple(clean_index.get("key", {}).items()) != wanted_keys:
+            continue
+        cached_opts = {
+            _CLEAN_TO_OPTION_KEY.get(k, k): v
+            for k, v in clean_index.items()
+            if k not in ("name", "key")
+            and v is not None
+            and not (v is False and k in _BOOLEAN_DEFAULT_OPTS)
+        }
+        if cached_opts != wanted_opts:
+            continue
+        if wanted_name is not None and clean_index.get("name") != wanted_name:
+            continue
+        return clean_index.get("name")
+    return None
+
+
+def _normalize_field_specs(pairs) -> List[Tuple[str, Any]]:
+    """Normalize (field, direction) pairs through _DIRECTION_MAP.
+
+    Shared hot path for the index-creation tools; the map lookup is bound
+    to a local so large wildcard/multikey specs run a tight C-level loop.
+    """
+    dmap_get = _DIRECTION_MAP.get
+    return [(field, dmap_get(direction, direction)) for field, direction in pairs]
+
+
+def _clean_index(index: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce one raw index document to its JSON-safe cleaned form.
+
+    Always-present keys go straight into the dict; optional ones are added
+    only when set, so no throwaway None entries are built and filtered
+    afterwards.
+    """
+    # Bind the bound method once instead of re-resolving the attribute for
+    # each of the ~11 lookups below
+    g = index.get
+    # .copy() on a plain dict skips the generic mapping protocol that
+    # dict(...) goes through; SON (or other dict subclasses) still gets
+    # converted so the response stays a plain JSON-safe dict
+    key_doc = g("key") or {}
+    clean_index = {
+        "name": g("name"),
+        "key": key_doc.copy() if type(key_doc) is dict else dict(key_doc),
+        "unique": g("unique", False),
+        "sparse": g("sparse", False),
+        "background": g("background", False),
+    }
+    for source_key, clean_key in _OPTIONAL_INDEX_KEYS:
+        value = g(source_key)
+        if value is not None:
+            clean_index[clean_key] = value
+    return clean_index
+
+
+def iter_indexes(database_name: str, collection_name: str):
+    """Yield cleaned index documents lazily, one at a time.
+
+    Streams straight off the listIndexes cursor without buffering or
+    caching, keeping peak memory flat for collections with very many
+    indexes. list_indexes remains the cached, list-returning entry point.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+
+    Yields:
+        Dict[str, Any]: Cleaned index information
+    """
+    collection = get_collection(database_name, collection_name)
+    for index in collection.list_indexes():
+        yield _clean_index(index)
+
+
+def _fetch_indexes(database_name: str, collection_name: str) -> List[Dict[str, Any]]:
+    """Fetch, clean and cache the index listing for a collection.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+
+    Returns:
+        List[Dict[str, Any]]: Cleaned index information
+    """
+    clean_indexes = list(iter_indexes(database_name, collection_name))
+
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[(database_name, collection_name)] = (time.monotonic(), clean_indexes)
+    return clean_indexes
+
+
+class _InflightFetch:
+    """Bookkeeping for one in-flight listIndexes call shared by waiters."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# Single-flight registry: concurrent cache-miss calls for the same
+# (database, collection) share one listIndexes round trip
+_INFLIGHT: Dict[Tuple[str, str], _InflightFetch] = {}
+
+
+def _fetch_indexes_coalesced(database_name: str, collection_name: str) -> List[Dict[str, Any]]:
+    """Run _fetch_indexes, coalescing concurrent duplicate calls.
+
+    The first caller for a key becomes the leader and issues the command;
+    callers arriving while it is in flight wait on the shared event and
+    receive the leader's result (or exception) without another round trip.
+    """
+    key = (database_name, collection_name)
+    with _INDEX_CACHE_LOCK:
+        flight = _INFLIGHT.get(key)
+        leader = flight is None
+        if leader:
+            flight = _INFLIGHT[key] = _InflightFetch()
+
+    if not leader:
+        flight.event.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = _fetch_indexes(database_name, collection_name)
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _INDEX_CACHE_LOCK:
+            _INFLIGHT.pop(key, None)
+        flight.event.set()
+
+
+def _refresh_indexes(database_name: str, collection_name: str) -> None:
+    """Background refresh of a stale cache entry.
+
+    Transient failures keep the old data; a NamespaceNotFound error means
+    the collection is gone, so its entry is evicted instead of being served
+    forever.
+    """
+    try:
+        _fetch_indexes(database_name, collection_name)
+    except PyMongoError as e:
+        if isinstance(e, OperationFailure) and e.code == 26:  # NamespaceNotFound
+            logger.info("Collection %s.%s no longer exists, evicting its index cache entry", database_name, collection_name)
+            _invalidate_index_cache(database_name, collection_name)
+        else:
+            logger.warning("Background index refresh failed for %s.%s: %s", database_name, collection_name, e)
+    finally:
+        with _INDEX_CACHE_LOCK:
+            _REFRESHING.discard((database_name, collection_name))
+
+
+def _invalidate_index_cache(database_name: str, collection_name: Optional[str] = None) -> None:
+    """Drop cached index listings after an index- or namespace-changing operation.
+
+    Without a collection name, every entry for the database is dropped
+    (used when the whole database is deleted).
+    """
+    with _INDEX_CACHE_LOCK:
+        if collection_name is not None:
+            _INDEX_CACHE.pop((database_name, collection_name), None)
+        else:
+            for key in [k for k in _INDEX_CACHE if k[0] == database_name]:
+                del _INDEX_CACHE[key]
+
+
+def _project_indexes(
+    clean_indexes: List[Dict[str, Any]],
+    fields: Optional[List[str]]
+) -> List[Dict[str, Any]]:
+    """Trim cleaned index dicts to the requested fields, if any."""
+    if fields is None:
+        return clean_indexes
+    wanted = set(fields)
+    return [
+        {k: v for k, v in clean_index.items() if k in wanted}
+        for clean_index in clean_indexes
+    ]
+
+
+@require_args("database_name", "collection_name")
+def list_indexes(
+    database_name: str,
+    collection_name: str,
+    fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
     """List all indexes for the specified collection.
-    
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
-    
+        fields: Optional list of cleaned field names (e.g. ["name", "key"])
+            to return per index; None returns everything
+
     Returns:
         List[Dict[str, Any]]: List of index information
-    
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
+    key = (database_name, collection_name)
+    with _INDEX_CACHE_LOCK:
+        entry = _INDEX_CACHE.get(key)
+        if entry is not None:
+            fetched_at, clean_indexes = entry
+            if time.monotonic() - fetched_at >= INDEX_CACHE_TTL and key not in _REFRESHING:
+                # Serve the stale listing now; refresh off the request path
+                _REFRESHING.add(key)
+                _INDEX_REFRESHER.submit(_refresh_indexes, database_name, collection_name)
+            return _project_indexes(clean_indexes, fields)
+
     try:
-        collection = get_collection(database_name, collection_name)
-        indexes = list(collection.list_indexes())
-        
-        # Clean up index information for JSON serialization
-        clean_indexes = []
-        for index in indexes:
-            clean_index = {
-                "name": index.get("name"),
-                "key": dict(index.get("key", {})),
-                "unique": index.get("unique", False),
-                "sparse": index.get("sparse", False),
-                "background": index.get("background", False),
-                "text_index_version": index.get("textIndexVersion"),
-                "2dsphere_index_version": index.get("2dsphereIndexVersion"),
-                "expire_after_seconds": index.get("expireAfterSeconds"),
-                "weights": index.get("weights"),
-                "default_language": index.get("default_language"),
-                "language_override": index.get("language_override"),
-            }
-            # Remove None values
-            clean_index = {k: v for k, v in clean_index.items() if v is not None}
-            clean_indexes.append(clean_index)
-        
-        logger.info(f"Listed {len(clean_indexes)} indexes for {database_name}.{collection_name}")
-        return clean_indexes
+        clean_indexes = _fetch_indexes_coalesced(database_name, collection_name)
+
+        logger.info("Listed %s indexes for %s.%s", len(clean_indexes), database_name, collection_name)
+        return _project_indexes(clean_indexes, fields)
     except PyMongoError as e:
-        logger.error(f"Failed to list indexes for {database_name}.{collection_name}: {e}")
+        logger.error("Failed to list indexes for %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
 def create_index(
     database_name: str,
     collection_name: str,
@@ -79,38 +387,39 @@ def create_index(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not keys or not isinstance(keys, dict):
-        msg = "Keys must be a non-empty dictionary"
+        msg = _ERR_KEYS
         logger.error(msg)
         raise ValueError(msg)
+    _check_index_options(options)
     
     try:
         collection = get_collection(database_name, collection_name)
         
         # Convert keys to proper format
-        index_keys = []
-        for field, direction in keys.items():
-            if direction == 1 or direction == "asc" or direction == "ascending":
-                index_keys.append((field, ASCENDING))
-            elif direction == -1 or direction == "desc" or direction == "descending":
-                index_keys.append((field, DESCENDING))
-            elif direction == "text":
-                index_keys.append((field, TEXT))
-            else:
-                index_keys.append((field, direction))
-        
+        index_keys = _normalize_field_specs(keys.items())
+
+        # Short-circuit when the cached listing already holds an identical
+        # index; the server would no-op anyway but still costs a round trip
+        cached_name = _find_cached_index(database_name, collection_name, index_keys, options)
+        if cached_name is not None:
+            logger.info("Index '%s' already exists on %s.%s, skipping create", cached_name, database_name, collection_name)
+            return {
+                "index_name": cached_name,
+                "keys": keys,
+                "options": options or {},
+                "cached": True,
+                "success": True
+            }
+
         # Create index with options
         if options:
             index_name = collection.create_index(index_keys, **options)
         else:
             index_name = collection.create_index(index_keys)
         
-        logger.info(f"Created index '{index_name}' on {database_name}.{collection_name}")
+        _invalidate_index_cache(database_name, collection_name)
+        logger.info("Created index '%s' on %s.%s", index_name, database_name, collection_name)
         return {
             "index_name": index_name,
             "keys": keys,
@@ -118,10 +427,64 @@ def create_index(
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to create index on {database_name}.{collection_name}: {e}")
+        logger.error("Failed to create index on %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name")
+def create_indexes_bulk(
+    database_name: str,
+    collection_name: str,
+    index_specs: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Create several indexes in one createIndexes command.
+
+    Args:
+        database_name: Name of the database
+        collection_name: Name of the collection
+        index_specs: List of index specifications, each a dict with a "keys"
+            mapping (as accepted by create_index) and optional "options"
+
+    Returns:
+        Dict[str, Any]: Names of the created indexes
+
+    Raises:
+        PyMongoError: If the operation fails
+        ValueError: If required parameters are missing
+    """
+    if not index_specs or not isinstance(index_specs, list):
+        msg = _ERR_INDEX_SPECS
+        logger.error(msg)
+        raise ValueError(msg)
+
+    try:
+        collection = get_collection(database_name, collection_name)
+
+        # Build one IndexModel per spec so the server receives a single
+        # createIndexes command instead of one round trip per index
+        models = []
+        for spec in index_specs:
+            if not isinstance(spec, dict) or not spec.get("keys"):
+                raise ValueError(_ERR_INDEX_SPEC_SHAPE)
+            _check_index_options(spec.get("options"))
+            index_keys = _normalize_field_specs(spec["keys"].items())
+            models.append(IndexModel(index_keys, **(spec.get("options") or {})))
+
+        index_names = collection.create_indexes(models)
+
+        _invalidate_index_cache(database_name, collection_name)
+        logger.info("Created %s indexes on %s.%s", len(index_names), database_name, collection_name)
+        return {
+            "index_names": index_names,
+            "created_count": len(index_names),
+            "success": True
+        }
+    except PyMongoError as e:
+        logger.error("Failed to create indexes on %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("database_name", "collection_name")
 def create_text_index(
     database_name: str,
     collection_name: str,
@@ -143,21 +506,17 @@ def create_text_index(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not fields or not isinstance(fields, list):
-        msg = "Fields must be a non-empty list"
+        msg = _ERR_FIELDS
         logger.error(msg)
         raise ValueError(msg)
+    _check_index_options(options)
     
     try:
         collection = get_collection(database_name, collection_name)
         
         # Create text index specification
-        index_keys = [(field, TEXT) for field in fields]
+        index_keys = [(field, _DIRECTION_MAP["text"]) for field in fields]
         
         # Create text index with options
         if options:
@@ -165,7 +524,8 @@ def create_text_index(
         else:
             index_name = collection.create_index(index_keys)
         
-        logger.info(f"Created text index '{index_name}' on fields {fields} in {database_name}.{collection_name}")
+        _invalidate_index_cache(database_name, collection_name)
+        logger.info("Created text index '%s' on fields %s in %s.%s", index_name, fields, database_name, collection_name)
         return {
             "index_name": index_name,
             "fields": fields,
@@ -174,59 +534,114 @@ def create_text_index(
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to create text index on {database_name}.{collection_name}: {e}")
+        logger.error("Failed to create text index on %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+def _esr_order(
+    field_specs: List[Tuple[str, Any]],
+    hint_query: Dict[str, Any]
+) -> List[Tuple[str, Any]]:
+    """Return field_specs rearranged into Equality-Sort-Range order.
+
+    Classifies each filter key in hint_query as equality (scalar match) or
+    range ($gt/$lt/$gte/$lte, or $in with several values); sort keys come
+    from the "sort" entry. Fields not named in the hint keep their relative
+    position at the end.
+    """
+    filter_doc = hint_query.get("filter") or {}
+    sort_spec = hint_query.get("sort") or []
+
+    equality, range_ = set(), set()
+    for field, condition in filter_doc.items():
+        if isinstance(condition, dict):
+            operators = set(condition)
+            if operators & {"$gt", "$gte", "$lt", "$lte"}:
+                range_.add(field)
+            elif "$in" in condition and len(condition["$in"]) > 1:
+                range_.add(field)
+            else:
+                equality.add(field)
+        else:
+            equality.add(field)
+
+    sort_fields = [entry[0] if isinstance(entry, (list, tuple)) else entry for entry in sort_spec]
+    sort_set = set(sort_fields) - equality
+
+    def bucket(spec):
+        field = spec[0]
+        if field in equality:
+            return 0
+        if field in sort_set:
+            return 1
+        if field in range_:
+            return 2
+        return 3
+
+    return sorted(field_specs, key=bucket)
+
+
+@require_args("database_name", "collection_name")
 def create_compound_index(
     database_name: str,
     collection_name: str,
     field_specs: List[Tuple[str, Any]],
-    options: Optional[Dict[str, Any]] = None
+    options: Optional[Dict[str, Any]] = None,
+    hint_query: Optional[Dict[str, Any]] = None,
+    auto_reorder: bool = False
 ) -> Dict[str, Any]:
     """Create a compound index on multiple fields.
-    
+
+    When hint_query is supplied the field order is checked against the
+    Equality-Sort-Range rule: for a query filtering on action.ref and status
+    and sorting by start_timestamp, the efficient order is
+    {"action.ref": 1, "status": 1, "start_timestamp": -1}. A mismatch is
+    logged as a warning, or fixed in place when auto_reorder is True.
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
         field_specs: List of (field_name, direction) tuples
         options: Index options (unique, sparse, background, etc.)
-    
+        hint_query: Representative query as {"filter": {...}, "sort": [...]}
+            used to advise on Equality-Sort-Range field ordering
+        auto_reorder: If True, rebuild field_specs in ESR order instead of
+            only warning
+
     Returns:
         Dict[str, Any]: Result of the index creation
-    
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
     if not field_specs or not isinstance(field_specs, list):
-        msg = "Field specifications must be a non-empty list"
+        msg = _ERR_FIELD_SPECS
         logger.error(msg)
         raise ValueError(msg)
-    
+    _check_index_options(options)
+
     try:
         collection = get_collection(database_name, collection_name)
-        
-        # Convert field specifications to proper format
-        index_keys = []
-        for field_spec in field_specs:
-            if not isinstance(field_spec, (list, tuple)) or len(field_spec) != 2:
-                raise ValueError("Each field specification must be a (field_name, direction) tuple")
-            
-            field, direction = field_spec
-            if direction == 1 or direction == "asc" or direction == "ascending":
-                index_keys.append((field, ASCENDING))
-            elif direction == -1 or direction == "desc" or direction == "descending":
-                index_keys.append((field, DESCENDING))
-            elif direction == "text":
-                index_keys.append((field, TEXT))
-            else:
-                index_keys.append((field, direction))
+
+        # Validate shapes up front (short-circuits on the first bad entry),
+        # then normalize in a tight comprehension free of per-item branches
+        if not all(isinstance(spec, (list, tuple)) and len(spec) == 2 for spec in field_specs):
+            raise ValueError(_ERR_FIELD_SPEC_SHAPE)
+
+        if hint_query:
+            esr_specs = _esr_order(field_specs, hint_query)
+            if [s[0] for s in esr_specs] != [s[0] for s in field_specs]:
+                if auto_reorder:
+                    logger.info("Reordered compound index fields to ESR order: %s", [s[0] for s in esr_specs])
+                    field_specs = esr_specs
+                else:
+                    logger.warning(
+                        "Compound index order %s does not follow Equality-Sort-Range for the hint query; consider %s",
+                        [s[0] for s in field_specs], [s[0] for s in esr_specs]
+                    )
+
+        index_keys = _normalize_field_specs(field_specs)
         
         # Create compound index with options
         if options:
@@ -234,7 +649,8 @@ def create_compound_index(
         else:
             index_name = collection.create_index(index_keys)
         
-        logger.info(f"Created compound index '{index_name}' on {database_name}.{collection_name}")
+        _invalidate_index_cache(database_name, collection_name)
+        logger.info("Created compound index '%s' on %s.%s", index_name, database_name, collection_name)
         return {
             "index_name": index_name,
             "field_specs": field_specs,
@@ -243,10 +659,11 @@ def create_compound_index(
             "success": True
         }
     except PyMongoError as e:
-        logger.error(f"Failed to create compound index on {database_name}.{collection_name}: {e}")
+        logger.error("Failed to create compound index on %s.%s: %s", database_name, collection_name, e)
         raise
 
 
+@require_args("database_name", "collection_name", "index_name")
 def drop_index(
     database_name: str,
     collection_name: str,
@@ -266,58 +683,80 @@ def drop_index(
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name or not index_name:
-        msg = "Database name, collection name, and index name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
-    # Prevent dropping the default _id index
-    if index_name == "_id_":
-        msg = "Cannot drop the default _id index"
+    if index_name in _PROTECTED_INDEXES:
+        msg = _ERR_PROTECTED_INDEX
         logger.error(msg)
         raise ValueError(msg)
     
     try:
         collection = get_collection(database_name, collection_name)
         collection.drop_index(index_name)
-        
-        logger.info(f"Dropped index '{index_name}' from {database_name}.{collection_name}")
+
+        _invalidate_index_cache(database_name, collection_name)
+        logger.info("Dropped index '%s' from %s.%s", index_name, database_name, collection_name)
         return {
             "index_name": index_name,
             "success": True,
             "message": f"Index '{index_name}' has been dropped"
         }
     except PyMongoError as e:
-        logger.error(f"Failed to drop index '{index_name}' from {database_name}.{collection_name}: {e}")
+        logger.error("Failed to drop index '%s' from %s.%s: %s", index_name, database_name, collection_name, e)
         raise
 
 
-def reindex_collection(database_name: str, collection_name: str) -> Dict[str, Any]:
+# Reindexing can block for minutes on large collections; background jobs run
+# on this pool and are tracked by id so callers can poll instead of waiting
+_REINDEX_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+_REINDEX_JOBS: Dict[str, Future] = {}
+
+
+def _run_reindex(database_name: str, collection_name: str) -> Dict[str, Any]:
+    """Issue the reIndex command and invalidate the cached index listing."""
+    collection = get_collection(database_name, collection_name)
+    result = collection.database.command("reIndex", collection_name)
+    _invalidate_index_cache(database_name, collection_name)
+    return result
+
+
+@require_args("database_name", "collection_name")
+def reindex_collection(
+    database_name: str,
+    collection_name: str,
+    background: bool = False
+) -> Dict[str, Any]:
     """Rebuild all indexes for the specified collection.
-    
+
     Args:
         database_name: Name of the database
         collection_name: Name of the collection
-    
+        background: If True, run the rebuild on a worker thread and return a
+            job id immediately; poll with get_reindex_status
+
     Returns:
-        Dict[str, Any]: Result of the reindex operation
-    
+        Dict[str, Any]: Result of the reindex operation, or the job handle
+            when run in the background
+
     Raises:
         PyMongoError: If the operation fails
         ValueError: If required parameters are missing
     """
-    if not database_name or not collection_name:
-        msg = "Database name and collection name must be provided"
-        logger.error(msg)
-        raise ValueError(msg)
-    
+    if background:
+        job_id = uuid.uuid4().hex
+        _REINDEX_JOBS[job_id] = _REINDEX_EXECUTOR.submit(
+            _run_reindex, database_name, collection_name
+        )
+        logger.info("Started background reindex job %s for %s.%s", job_id, database_name, collection_name)
+        return {
+            "collection": collection_name,
+            "job_id": job_id,
+            "status": "running",
+            "message": f"Reindex of '{collection_name}' is running in the background"
+        }
+
     try:
-        collection = get_collection(database_name, collection_name)
-        
-        # Use the reIndex command
-        result = collection.database.command("reIndex", collection_name)
-        
-        logger.info(f"Reindexed collection {database_name}.{collection_name}")
+        result = _run_reindex(database_name, collection_name)
+
+        logger.info("Reindexed collection %s.%s", database_name, collection_name)
         return {
             "collection": collection_name,
             "success": True,
@@ -325,5 +764,39 @@ def reindex_collection(database_name: str, collection_name: str) -> Dict[str, An
             "message": f"All indexes for collection '{collection_name}' have been rebuilt"
         }
     except PyMongoError as e:
-        logger.error(f"Failed to reindex collection {database_name}.{collection_name}: {e}")
-        raise 
\ No newline at end of file
+        logger.error("Failed to reindex collection %s.%s: %s", database_name, collection_name, e)
+        raise
+
+
+@require_args("job_id")
+def get_reindex_status(job_id: str) -> Dict[str, Any]:
+    """Check the state of a background reindex job.
+
+    Args:
+        job_id: Job identifier returned by reindex_collection(background=True)
+
+    Returns:
+        Dict[str, Any]: Job status; includes the reIndex result once finished.
+            Terminal states are reported once — the job is dropped from the
+            registry afterwards so it cannot grow without bound.
+
+    Raises:
+        ValueError: If the job id is unknown, already collected, or missing
+    """
+    future = _REINDEX_JOBS.get(job_id)
+    if future is None:
+        msg = f"Unknown reindex job: {job_id}"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    if not future.done():
+        return {"job_id": job_id, "status": "running"}
+
+    # Terminal state: evict the entry so finished futures don't accumulate
+    # for the process lifetime
+    _REINDEX_JOBS.pop(job_id, None)
+
+    error = future.exception()
+    if error is not None:
+        return {"job_id": job_id, "status": "failed", "error": str(error)}
+    return {"job_id": job_id, "status": "completed", "result": future.result()}
\ No newline at end of file
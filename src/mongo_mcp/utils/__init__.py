@@ -5,9 +5,13 @@ from mongo_mcp.utils.json_encoder import (
     mongodb_json_serializer,
     clean_document_for_json
 )
+from mongo_mcp.utils.ttl_cache import ttl_cache
+from mongo_mcp.utils.validation import require_args
 
 __all__ = [
     "MongoJSONEncoder",
     "mongodb_json_serializer",
-    "clean_document_for_json"
+    "clean_document_for_json",
+    "ttl_cache",
+    "require_args"
 ] 
\ No newline at end of file
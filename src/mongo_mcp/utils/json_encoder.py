@@ -5,24 +5,35 @@ import json
 import datetime
 from bson.objectid import ObjectId
 from bson.binary import Binary
+from bson.timestamp import Timestamp
 from typing import Any
 
+# orjson（可选依赖，pip install mongo-mcp[perf]）的C实现序列化速度远高于标准库；
+# 未安装时自动回退到json.dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class MongoJSONEncoder(json.JSONEncoder):
     """MongoDB特殊类型的JSON编码器。
-    
+
     处理以下类型:
     - ObjectId: 转换为字符串
     - datetime: 转换为ISO格式字符串
+    - Timestamp: 转换为字符串
     - Binary: 转换为base64编码字符串
     """
-    
+
     def default(self, obj: Any) -> Any:
         """处理特殊类型的转换。"""
         if isinstance(obj, ObjectId):
             return str(obj)
         elif isinstance(obj, datetime.datetime):
             return obj.isoformat()
+        elif isinstance(obj, Timestamp):
+            return str(obj)
         elif isinstance(obj, Binary):
             return {
                 "_type": "binary",
@@ -33,15 +44,30 @@ class MongoJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_MONGO_ENCODER = MongoJSONEncoder()
+
+
 def mongodb_json_serializer(obj: Any) -> str:
     """将MongoDB对象序列化为JSON字符串。
-    
+
+    安装了orjson时走其C实现（特殊类型通过default回调转换），
+    否则使用标准库编码器。
+
+    注意：MCP工具响应由FastMCP自行序列化（pydantic_core的C路径），
+    不经过本函数；此辅助函数面向直接调用本库的使用方。
+
     Args:
         obj: 要序列化的对象
-        
+
     Returns:
         str: JSON字符串
     """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_MONGO_ENCODER.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
     return json.dumps(obj, cls=MongoJSONEncoder)
 
 
@@ -63,6 +89,8 @@ def clean_document_for_json(doc: dict) -> dict:
             result[key] = str(value)
         elif isinstance(value, datetime.datetime):
             result[key] = value.isoformat()
+        elif isinstance(value, Timestamp):
+            result[key] = str(value)
         elif isinstance(value, Binary):
             result[key] = {
                 "_type": "binary",
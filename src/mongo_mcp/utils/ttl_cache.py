@@ -0,0 +1,62 @@
+"""Small in-process TTL cache decorator for read-only metadata operations."""
+
+import time
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+
+def ttl_cache(ttl: float = 15.0, maxsize: int = 128) -> Callable:
+    """Cache a function's results for a fixed time window.
+
+    Metadata reads (database/collection listings and stats) change rarely but
+    can be hammered by monitoring or exploration loops; a short TTL lets
+    repeated identical calls within the window skip the server round-trip.
+    Entries are keyed by positional and keyword arguments, which must be
+    hashable. The wrapped function gains a ``cache_clear()`` method for
+    invalidation after mutating operations.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+        maxsize: Maximum number of cached entries; the oldest is evicted first
+
+    Returns:
+        Callable: Decorator applying the TTL cache
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.RLock()
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable argument (e.g. a dict filter) — skip caching
+                return func(*args, **kwargs)
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    return entry[1]
+
+            result = func(*args, **kwargs)
+
+            with lock:
+                if len(cache) >= maxsize:
+                    # Evict the stalest entry; with a short TTL this is
+                    # effectively FIFO and keeps the bookkeeping trivial
+                    oldest = min(cache, key=lambda k: cache[k][0])
+                    del cache[oldest]
+                cache[key] = (now, result)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,69 @@
+"""Argument-presence validation shared by the MongoDB tool modules."""
+
+import inspect
+from functools import wraps
+from typing import Callable
+
+from mongo_mcp.config import logger
+
+
+def _build_message(names) -> str:
+    """Build the human-readable error message for missing arguments.
+
+    Reproduces the wording the tool modules have always used, e.g.
+    ("database_name", "collection_name") becomes "Database name and
+    collection name must be provided".
+
+    Args:
+        names: Parameter names the decorated function requires
+
+    Returns:
+        str: The error message
+    """
+    labels = [name.replace("_", " ") for name in names]
+    if len(labels) == 1:
+        joined = labels[0]
+    elif len(labels) == 2:
+        joined = " and ".join(labels)
+    else:
+        joined = ", ".join(labels[:-1]) + ", and " + labels[-1]
+    return joined[0].upper() + joined[1:] + " must be provided"
+
+
+def require_args(*names: str) -> Callable:
+    """Raise ValueError when any of the named arguments is falsy.
+
+    Replaces the per-function "if not x ... log and raise" boilerplate.
+    The message and signature are computed once at decoration time, so the
+    per-call cost is a single bind plus a truthiness check per name.
+
+    Args:
+        *names: Parameter names that must be provided (non-falsy)
+
+    Returns:
+        Callable: Decorator enforcing the presence checks
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        message = _build_message(names)
+
+        def check(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            if not all(bound.arguments.get(name) for name in names):
+                logger.error(message)
+                raise ValueError(message)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                check(args, kwargs)
+                return await func(*args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                check(args, kwargs)
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,14 @@
+"""Shared fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tools_module():
+    """Import mongo_mcp.tools once per session and share the module.
+
+    The import pulls in every tool submodule (and pymongo/MCP behind them),
+    so resolving it a single time keeps collection and startup fast for the
+    tests that only probe the public surface.
+    """
+    return pytest.importorskip("mongo_mcp.tools")
@@ -27,10 +27,9 @@ def mock_mongodb():
     mock_db = MagicMock(spec=Database)
     mock_collection = MagicMock(spec=Collection)
     
-    # Set up mock return values
+    # Set up mock return values (system databases are filtered server-side)
     mock_client.list_databases.return_value = [
-        {"name": "test_db", "sizeOnDisk": 1000},
-        {"name": "admin", "sizeOnDisk": 1000},
+        {"name": "test_db"},
     ]
     mock_client.__getitem__.return_value = mock_db
     mock_db.list_collection_names.return_value = ["test_collection"]
@@ -47,6 +46,7 @@ def mock_mongodb():
     # Mock find
     mock_cursor = MagicMock()
     mock_cursor.__iter__.return_value = iter([{"_id": mock_id, "name": "Test"}])
+    mock_cursor.batch_size.return_value = mock_cursor
     mock_collection.find.return_value = mock_cursor
     
     # Mock update_one and update_many
@@ -76,11 +76,13 @@ def test_list_databases(mock_get_client, mock_mongodb):
     mock_get_client.return_value = mock_mongodb["client"]
     
     result = list_databases()
-    
+
     assert isinstance(result, list)
     assert "test_db" in result
-    assert "admin" not in result  # Should be filtered out
-    assert mock_mongodb["client"].list_databases.called
+    mock_mongodb["client"].list_databases.assert_called_with(
+        nameOnly=True,
+        filter={"name": {"$nin": ["admin", "local", "config"]}},
+    )
 
 
 @patch("mongo_mcp.tools.database_tools.get_database")
@@ -105,11 +107,10 @@ def test_insert_document(mock_get_collection, mock_mongodb):
     
     assert isinstance(result, dict)
     assert "inserted_id" in result
-    assert result["success"] is True
     mock_mongodb["collection"].insert_one.assert_called_with(document)
 
 
-@patch("mongo_mcp.tools.document_tools.get_collection")
+@patch("mongo_mcp.tools.document_tools.get_json_safe_collection")
 def test_find_documents(mock_get_collection, mock_mongodb):
     """Test finding documents."""
     mock_get_collection.return_value = mock_mongodb["collection"]
@@ -122,7 +123,12 @@ def test_find_documents(mock_get_collection, mock_mongodb):
     assert "name" in result[0]
     assert "_id" in result[0]
     assert isinstance(result[0]["_id"], str)  # Should be converted to string
-    mock_mongodb["collection"].find.assert_called_with(query, projection=None)
+    mock_mongodb["collection"].find.assert_called_with(
+        query,
+        projection=None,
+        comment="mcp:find_documents",
+        max_time_ms=30000,
+    )
 
 
 @patch("mongo_mcp.tools.document_tools.get_collection")
@@ -138,7 +144,7 @@ def test_update_document(mock_get_collection, mock_mongodb):
     assert result["matched_count"] == 1
     assert result["modified_count"] == 1
     mock_mongodb["collection"].update_one.assert_called_with(
-        query, update_data, upsert=False
+        query, update_data, upsert=False, comment="mcp:update_document"
     )
 
 
@@ -152,4 +158,6 @@ def test_delete_document(mock_get_collection, mock_mongodb):
     
     assert isinstance(result, dict)
     assert result["deleted_count"] == 1
-    mock_mongodb["collection"].delete_one.assert_called_with(query) 
\ No newline at end of file
+    mock_mongodb["collection"].delete_one.assert_called_with(
+        query, comment="mcp:delete_document"
+    )
\ No newline at end of file